@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Days-Until Benchmark - Scalar days_until_event calls vs the per-date table.
+
+Both paths are checked to agree before timing. Needs no GTK:
+
+    python benchmarks/bench_days_until.py -n 10000 100000 1000000
+"""
+
+import argparse
+import random
+
+import common
+from data_manager import DataManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--events', type=int, nargs='+', default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+    rng = random.Random(7)
+    print(f"{'events':>8}  {'scalar ms':>10}  {'batch ms':>9}")
+    for count in args.events:
+        days = [rng.randint(1, 31) for _ in range(count)]
+        months = [rng.randint(1, 12) for _ in range(count)]
+
+        def scalar():
+            return [DataManager.days_until_event(d, m) for d, m in zip(days, months)]
+
+        def batch():
+            return DataManager.days_until_events(days, months)
+
+        assert list(batch()) == scalar()
+        repeat = 3 if count >= 1000000 else 5
+        print(f"{count:>8}  {common.best_ms(scalar, repeat):>10.1f}  "
+              f"{common.best_ms(batch, repeat):>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Event Style Benchmark - Holiday keyword matching and the style cache.
+
+Times get_event_style plus is_fire_easter_egg per name: unique ordinary
+names and unique holiday-heavy names with a cold cache, then repeated
+lookups over a small set of names, as when list rows are rebound on
+scroll. birthday_row imports GTK, so this one needs PyGObject with GTK 4
+(no display):
+
+    python benchmarks/bench_event_style.py -n 100000
+"""
+
+import argparse
+import random
+import time
+
+import common  # noqa: F401  (puts candela/ on sys.path)
+from birthday_row import HOLIDAY_STYLES, get_event_style, is_fire_easter_egg
+
+WORDS = ['Anna', 'Zeynep', 'Emre', 'Can', 'Lucas', 'Marie', 'work', 'Mom', 'Dad',
+         'Grandma', 'Elif', 'Ali', 'Kemal', 'Sofia', 'Noah', 'Mia']
+TYPES = [('birthday', None), ('anniversary', 'wedding'), ('special', None),
+         ('anniversary', 'memorial')]
+
+
+def make_names(count: int, words, rng: random.Random):
+    return [(rng.choice(TYPES), ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+             + f' {i}') for i in range(count)]
+
+
+def style_all(names) -> float:
+    """Milliseconds to style every (type, name) pair."""
+    start = time.perf_counter()
+    for (event_type, anniversary_type), name in names:
+        get_event_style(event_type, anniversary_type, name)
+        is_fire_easter_egg(name)
+    return (time.perf_counter() - start) * 1000
+
+
+def cold(names) -> float:
+    get_event_style.cache_clear()
+    is_fire_easter_egg.cache_clear()
+    return style_all(names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--events', type=int, default=100000)
+    args = parser.parse_args()
+    rng = random.Random(7)
+    # About a third of the words are holiday keywords
+    holiday_words = WORDS + list(HOLIDAY_STYLES)[:len(WORDS) // 2]
+    ordinary = make_names(args.events, WORDS, rng)
+    holidays = make_names(args.events, holiday_words, rng)
+    rebinds = ordinary[:2000] * (args.events // 2000)
+    print(f"ordinary names, cold cache:       {cold(ordinary):7.0f} ms")
+    print(f"holiday-heavy names, cold cache:  {cold(holidays):7.0f} ms")
+    print(f"{len(rebinds)} lookups over 2000 names: {cold(rebinds):7.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
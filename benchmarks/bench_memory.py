@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Memory Benchmark - Bytes per event held as parsed dicts vs Event records.
+
+Parses a generated events.json under tracemalloc and keeps either the
+plain dicts or the Event records built from them. Needs no GTK:
+
+    python benchmarks/bench_memory.py -n 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+import common
+from event_model import Event
+
+
+def measure(text: str, as_records: bool) -> int:
+    """Bytes still allocated after loading the events one way."""
+    gc.collect()
+    tracemalloc.start()
+    events = json.loads(text)['events']
+    if as_records:
+        events = [Event.from_dict(data) for data in events]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--events', type=int, default=100000)
+    args = parser.parse_args()
+    text = json.dumps({'events': common.make_events(args.events)})
+    for label, as_records in (('dict per event', False), ('Event record', True)):
+        size = measure(text, as_records)
+        print(f"{label:>15}: {size / args.events:6.0f} B/event ({size / 2**20:.1f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
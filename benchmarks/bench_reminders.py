@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Reminder Catch-up Benchmark - Ledger load and catch-up after downtime.
+
+Simulates a month of daily reminder runs, then a week offline, and times
+reading the ledger and sending what was missed on the next start.
+Reminders are counted instead of shown. reminders imports Gio and GLib,
+so this needs PyGObject (no display):
+
+    python benchmarks/bench_reminders.py -n 10000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import common
+from data_manager import DataManager
+from reminders import ReminderService
+
+# Days of daily runs before going offline, and days offline
+DAYS_RUNNING = 30
+DAYS_OFFLINE = 7
+
+
+class CountingReminders(ReminderService):
+    """Counts reminders instead of sending notifications."""
+
+    def __init__(self, data_manager: DataManager):
+        super().__init__(None, data_manager)
+        # Let the initial background load finish first
+        data_manager.flush()
+        self.sent = 0
+
+    def _send(self, event, days_until, day):
+        self.sent += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--events', type=int, default=10000)
+    args = parser.parse_args()
+    data_dir = common.use_temp_data_dir()
+    data_manager = DataManager()
+    data_manager.save_events(common.make_events(args.events))
+    now = datetime.now().replace(hour=10)
+
+    service = CountingReminders(data_manager)
+    service.ledger.load((now - timedelta(days=DAYS_RUNNING + DAYS_OFFLINE)).date())
+    for days_back in range(DAYS_RUNNING + DAYS_OFFLINE, DAYS_OFFLINE, -1):
+        service.send_due(now - timedelta(days=days_back))
+    service.stop()
+    data_manager.flush()
+    with open(data_dir / 'reminders.ledger', encoding='utf-8') as f:
+        lines = sum(1 for _ in f)
+
+    service = CountingReminders(data_manager)
+    start = time.perf_counter()
+    service.ledger.load(now.date())
+    loaded = time.perf_counter()
+    service.send_due(now)
+    done = time.perf_counter()
+    service.stop()
+    data_manager.flush()
+    print(f"{args.events} events, ledger of {lines} lines: "
+          f"load {(loaded - start) * 1000:.2f} ms ({len(service.ledger)} live), "
+          f"catch-up {(done - loaded) * 1000:.2f} ms ({service.sent} sent)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Store Benchmark - Query and mutation throughput of DataManager per backend.
+
+Covers the in-memory store (get_sorted_events, update_event), the SQLite
+backend (upcoming, month, add) and paging through the sorted listing.
+Needs no GTK:
+
+    python benchmarks/bench_store.py
+    python benchmarks/bench_store.py -n 100000 -b sqlite
+"""
+
+import argparse
+
+import common
+from data_manager import DataManager
+
+
+def bench(backend: str, count: int):
+    common.use_temp_data_dir(backend)
+    data_manager = DataManager()
+    data_manager.save_events(common.make_events(count))
+    data_manager.flush()
+    # Fewer repeats for the whole-collection queries on large stores
+    repeat = max(3, 20000 // count)
+    event_ids = iter(range(1, count + 1))
+    results = {
+        'sorted/s': common.rate(data_manager.get_sorted_events, repeat),
+        'update/s': common.rate(lambda: data_manager.update_event(next(event_ids), notes='x'),
+                                min(count, 2000)),
+        'add/s': common.rate(lambda: data_manager.add_event('New', 1, 1), 500),
+        'upcoming(10)/s': common.rate(lambda: data_manager.get_upcoming(10), 20),
+        'month/s': common.rate(lambda: data_manager.get_events_in_month(5), 20),
+        'last page ms': common.best_ms(
+            lambda: data_manager.get_sorted_events(max(0, count - 1000), 50)),
+    }
+    data_manager.flush()
+    print(f"{backend:>6} {count:>7}  " +
+          '  '.join(f"{name} {value:,.1f}" for name, value in results.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--events', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('-b', '--backend', nargs='+', default=['json', 'sqlite'],
+                        choices=('json', 'sqlite'))
+    args = parser.parse_args()
+    for backend in args.backend:
+        for count in args.events:
+            bench(backend, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark Helpers - Paths, generated events and timing shared by the scripts.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# The application modules are flat files in candela/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'candela'))
+
+
+def use_temp_data_dir(backend: str = 'json') -> Path:
+    """Point new DataManagers at an empty data directory and a storage backend."""
+    data_home = Path(tempfile.mkdtemp(prefix='candela-bench-'))
+    os.environ['XDG_DATA_HOME'] = str(data_home)
+    os.environ['CANDELA_STORAGE'] = backend
+    return data_home / 'candela'
+
+
+def make_events(count: int, seed: int = 1) -> List[Dict]:
+    """Generate count birthdays in the events.json schema, with random dates."""
+    rng = random.Random(seed)
+    return [{'id': i, 'name': f'Person {i}', 'day': rng.randint(1, 28),
+             'month': rng.randint(1, 12), 'year': None, 'notes': '',
+             'event_type': 'birthday', 'anniversary_type': None, 'created_at': ''}
+            for i in range(1, count + 1)]
+
+
+def rate(fn: Callable[[], object], repeat: int) -> float:
+    """Calls per second of fn over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - start)
+
+
+def best_ms(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Fastest of repeat calls of fn, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
@@ -0,0 +1,182 @@
+"""
+Accent Color - Follows the desktop accent color through the settings portal.
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gtk, Gdk, Gio, GLib
+
+
+PORTAL_NAMESPACE = 'org.gnome.desktop.interface'
+PORTAL_KEY = 'accent-color'
+
+# Give up on a slow or missing portal after this many milliseconds
+PORTAL_TIMEOUT_MS = 1000
+
+# GNOME accent colors mapping
+ACCENT_COLORS = {
+    'blue': (0.22, 0.55, 0.92),
+    'teal': (0.13, 0.74, 0.61),
+    'green': (0.30, 0.69, 0.29),
+    'yellow': (0.96, 0.75, 0.14),
+    'orange': (0.90, 0.49, 0.13),
+    'red': (0.88, 0.26, 0.21),
+    'pink': (0.91, 0.33, 0.64),
+    'purple': (0.61, 0.35, 0.71),
+    'slate': (0.45, 0.52, 0.59),
+}
+
+ACCENT_CSS = """
+/* Upcoming events background */
+.event-list .upcoming-event {{
+    background-color: rgba({accent}, 0.12);
+}}
+
+/* Suggested action buttons (Add, Save, etc.) */
+.suggested-action {{
+    background-color: rgb({accent});
+    color: white;
+}}
+
+.suggested-action:hover {{
+    background-color: rgb({darker});
+}}
+
+/* Event type buttons when checked */
+.event-type-btn:checked {{
+    background-color: rgb({accent});
+    color: white;
+}}
+
+.event-type-btn:checked:hover {{
+    background-color: rgb({darker});
+}}
+
+/* Switch (Enable Notifications toggle) */
+switch:checked {{
+    background-color: rgb({accent});
+}}
+
+switch:checked:hover {{
+    background-color: rgb({darker});
+}}
+
+/* Calendar selected date */
+calendar:selected {{
+    background-color: rgb({accent});
+    color: white;
+}}
+
+calendar:selected:hover {{
+    background-color: rgb({darker});
+}}
+
+/* Alternative calendar selectors for GTK4 */
+.calendar .day:selected {{
+    background-color: rgb({accent});
+    color: white;
+}}
+
+.calendar .day.today {{
+    color: rgb({accent});
+    font-weight: bold;
+}}
+
+/* Calendar header and navigation */
+.calendar button.day:checked {{
+    background-color: rgb({accent});
+    color: white;
+}}
+"""
+
+
+def accent_css(red: float, green: float, blue: float) -> str:
+    """Build the accent stylesheet for an RGB color with channels in 0..1."""
+    accent = ', '.join(str(int(c * 255)) for c in (red, green, blue))
+    # A slightly darker version for hover states
+    darker = ', '.join(str(int(max(0, c - 0.1) * 255)) for c in (red, green, blue))
+    return ACCENT_CSS.format(accent=accent, darker=darker)
+
+
+class AccentWatcher:
+    """Keeps one CSS provider on a display in sync with the accent color.
+    
+    The portal is reached asynchronously with a short timeout, so a slow or
+    missing portal never holds up startup; its SettingChanged signal
+    re-colors the app live by reloading the same provider.
+    """
+    
+    def __init__(self, display: Gdk.Display):
+        self.display = display
+        self.accent_name = None
+        self._proxy = None
+        self._provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            self._provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
+        )
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SESSION,
+            Gio.DBusProxyFlags.DO_NOT_AUTO_START_AT_CONSTRUCTION,
+            None,
+            'org.freedesktop.portal.Desktop',
+            '/org/freedesktop/portal/desktop',
+            'org.freedesktop.portal.Settings',
+            None,
+            self._on_proxy_ready
+        )
+        
+    def _on_proxy_ready(self, source, result):
+        try:
+            self._proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except GLib.Error as e:
+            print(f"✗ Portal accent color read failed: {e.message}")
+            self._apply_fallback()
+            return
+        self._proxy.connect('g-signal', self._on_portal_signal)
+        self._proxy.call(
+            'ReadAll',
+            GLib.Variant('(as)', ([PORTAL_NAMESPACE],)),
+            Gio.DBusCallFlags.NONE,
+            PORTAL_TIMEOUT_MS,
+            None,
+            self._on_read_done
+        )
+        
+    def _on_read_done(self, proxy, result):
+        try:
+            settings_dict = proxy.call_finish(result).unpack()[0]
+        except GLib.Error as e:
+            print(f"✗ Portal accent color read failed: {e.message}")
+            self._apply_fallback()
+            return
+        self.set_accent(settings_dict.get(PORTAL_NAMESPACE, {}).get(PORTAL_KEY))
+        
+    def _on_portal_signal(self, proxy, sender_name, signal_name, parameters):
+        if signal_name != 'SettingChanged':
+            return
+        namespace, key, value = parameters.unpack()
+        if namespace == PORTAL_NAMESPACE and key == PORTAL_KEY:
+            self.set_accent(value)
+            
+    def set_accent(self, accent_name: str):
+        """Recolor the app for a GNOME accent color name."""
+        rgb = ACCENT_COLORS.get(accent_name)
+        if rgb is None:
+            self._apply_fallback()
+            return
+        self.accent_name = accent_name
+        self._provider.load_from_string(accent_css(*rgb))
+        
+    def _apply_fallback(self):
+        """Use the theme's accent color when the portal has none."""
+        temp_widget = Gtk.Label()
+        found, accent_rgba = temp_widget.get_style_context().lookup_color('accent_bg_color')
+        if found:
+            self.accent_name = None
+            self._provider.load_from_string(
+                accent_css(accent_rgba.red, accent_rgba.green, accent_rgba.blue))
+        else:
+            print("✗ No accent color could be determined")
@@ -2,13 +2,17 @@
 Event Row Widget - Custom row for displaying event entries with type-specific styling.
 """
 
+import re
+from functools import lru_cache
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Adw, GObject
 
-from translations import _, get_month_names
+from translations import _, format_event_date, get_formatter
+from event_model import Event
 from data_manager import (EVENT_TYPE_BIRTHDAY, EVENT_TYPE_ANNIVERSARY, EVENT_TYPE_SPECIAL,
                           ANNIVERSARY_WEDDING, ANNIVERSARY_RELATIONSHIP, ANNIVERSARY_MEMORIAL, ANNIVERSARY_OTHER)
 
@@ -186,15 +190,41 @@ HOLIDAY_STYLES = {
 }
 
 
+# Every holiday keyword in a single pattern, for a quick "any holiday?" test
+_HOLIDAY_KEYWORDS = {keyword.casefold(): index for index, keyword in enumerate(HOLIDAY_STYLES)}
+_HOLIDAY_ALTERNATION = '|'.join(re.escape(keyword) for keyword in _HOLIDAY_KEYWORDS)
+_HOLIDAY_PATTERN = re.compile(_HOLIDAY_ALTERNATION)
+# Keywords can overlap ("ramadan" / "anneler"), so names that do match are
+# rescanned with a lookahead that reports every position. At any one
+# position the alternation tries keywords in table order, so the earliest
+# table entry found anywhere wins, as with a scan of the table.
+_HOLIDAY_OVERLAPPING_PATTERN = re.compile('(?=(' + _HOLIDAY_ALTERNATION + '))')
+_HOLIDAY_STYLE_LIST = list(HOLIDAY_STYLES.values())
+
+# Easter egg: "11/B" in name + Valentine's related event = 🔥
+_VALENTINES_PATTERN = re.compile('sevgililer|valentine|san valent')
+
+# Distinct (name, type, subtype) combinations whose style is remembered
+STYLE_CACHE_SIZE = 4096
+
+
 def get_holiday_style(name):
     """Check if the event name matches a known holiday and return its style."""
-    name_lower = name.lower()
-    for keyword, style in HOLIDAY_STYLES.items():
-        if keyword.lower() in name_lower:
-            return style
-    return None
+    name = name.casefold()
+    if _HOLIDAY_PATTERN.search(name) is None:
+        return None
+    return _HOLIDAY_STYLE_LIST[min(_HOLIDAY_KEYWORDS[m.group(1)]
+                                   for m in _HOLIDAY_OVERLAPPING_PATTERN.finditer(name))]
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def is_fire_easter_egg(name):
+    """Check for the "11/B" + Valentine's easter egg."""
+    name = name.casefold()
+    return '11/b' in name and _VALENTINES_PATTERN.search(name) is not None
 
 
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
 def get_event_style(event_type, anniversary_type=None, event_name=None):
     """Get the style configuration for an event type."""
     # First check if it's a known holiday by name
@@ -210,124 +240,173 @@ def get_event_style(event_type, anniversary_type=None, event_name=None):
     return EVENT_STYLES.get(event_type, EVENT_STYLES[EVENT_TYPE_SPECIAL])
 
 
+class EventObject(GObject.Object):
+    """List model item wrapping an Event, for Gio.ListStore."""
+    
+    __gtype_name__ = 'CandelaEventObject'
+    
+    def __init__(self, event: Event):
+        super().__init__()
+        self.event = event
+
+
 class EventRow(Adw.ActionRow):
-    """A row widget for displaying an event entry."""
+    """A row widget for displaying an event entry.
+    
+    The child widgets are built once; bind() fills them in for an event, so
+    a list view can recycle the same row for whichever event scrolls in.
+    """
     
     __gtype_name__ = 'EventRow'
     
-    def __init__(self, event_data: dict, **kwargs):
+    def __init__(self, event_data: Event = None, upcoming_days: int = 7, **kwargs):
         super().__init__(**kwargs)
         
-        self.event_data = event_data
-        self._setup_row()
-        
-    def _setup_row(self):
-        """Set up the row display."""
-        name = self.event_data.get('name', 'Unknown')
-        day = self.event_data.get('day', 1)
-        month = self.event_data.get('month', 1)
-        year = self.event_data.get('year')
-        days_until = self.event_data.get('days_until', 0)
-        event_type = self.event_data.get('event_type', EVENT_TYPE_BIRTHDAY)
-        anniversary_type = self.event_data.get('anniversary_type')
-        
-        # Get style for this event type (with name for holiday detection)
-        style = get_event_style(event_type, anniversary_type, name)
-        
-        # Set title (name)
-        self.set_title(name)
-        
-        # Format date using translated month names
-        months = [''] + get_month_names()
-        
-        if year:
-            date_str = f"{day} {months[month]} {year}"
-        else:
-            date_str = f"{day} {months[month]}"
-        
-        self.set_subtitle(date_str)
+        self.event_data = None
+        self.upcoming_days = upcoming_days
+        self._style = None
+        self._build_row()
+        if event_data is not None:
+            self.bind(event_data, upcoming_days)
         
+    def _build_row(self):
+        """Create the child widgets shared by every event shown in this row."""
         # Days until badge with appropriate emoji
-        if days_until == 0:
-            days_text = _('today') + f" {style['emoji']}"
-        elif days_until == 1:
-            days_text = _('tomorrow') + "!"
-        else:
-            days_text = _('days_left').format(days_until)
-        
-        days_label = Gtk.Label(label=days_text)
-        days_label.add_css_class('dim-label')
-        days_label.set_valign(Gtk.Align.CENTER)
-        self.add_suffix(days_label)
+        self.days_label = Gtk.Label()
+        self.days_label.add_css_class('dim-label')
+        self.days_label.set_valign(Gtk.Align.CENTER)
+        self.add_suffix(self.days_label)
         
-        # Show year count for events with year
-        if year and event_type in [EVENT_TYPE_BIRTHDAY, EVENT_TYPE_ANNIVERSARY]:
-            from datetime import date
-            today = date.today()
-            next_occurrence_year = today.year if days_until > 0 or (days_until == 0) else today.year
-            if days_until > 0:
-                # Check if the event is this year or next year
-                try:
-                    this_year_date = date(today.year, month, day)
-                    if this_year_date < today:
-                        next_occurrence_year = today.year + 1
-                except ValueError:
-                    pass
-            
-            years_count = next_occurrence_year - year
-            if years_count > 0:
-                if event_type == EVENT_TYPE_BIRTHDAY:
-                    years_text = _('years_old').format(years_count)
-                else:
-                    years_text = _('anniversary_years').format(years_count)
-                years_label = Gtk.Label(label=years_text)
-                years_label.add_css_class('caption')
-                years_label.add_css_class('dim-label')
-                years_label.set_valign(Gtk.Align.CENTER)
-                self.add_suffix(years_label)
+        # Year count for events with year
+        self.years_label = Gtk.Label()
+        self.years_label.add_css_class('caption')
+        self.years_label.add_css_class('dim-label')
+        self.years_label.set_valign(Gtk.Align.CENTER)
+        self.add_suffix(self.years_label)
         
         # Special icons for August 31 (Special date in original code)
-        if day == 31 and month == 8:
-            special_label = Gtk.Label(label="🎄⭐")
-            special_label.set_valign(Gtk.Align.CENTER)
-            self.add_suffix(special_label)
+        self.special_label = Gtk.Label(label="🎄⭐")
+        self.special_label.set_valign(Gtk.Align.CENTER)
+        self.add_suffix(self.special_label)
         
         # Easter egg: "11/B" in name + Valentine's related event = 🔥
-        name_lower = name.lower()
-        is_valentines = ('sevgililer' in name_lower or 'valentine' in name_lower or 
-                         'san valent' in name_lower)
-        if '11/b' in name_lower and is_valentines:
-            fire_label = Gtk.Label(label="🔥")
-            fire_label.set_valign(Gtk.Align.CENTER)
-            self.add_suffix(fire_label)
+        self.fire_label = Gtk.Label(label="🔥")
+        self.fire_label.set_valign(Gtk.Align.CENTER)
+        self.add_suffix(self.fire_label)
         
         # Add event type icon prefix
         icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         icon_box.set_valign(Gtk.Align.CENTER)
         
         # Use emoji for visual appeal
-        emoji_label = Gtk.Label(label=style['emoji'])
-        emoji_label.add_css_class('event-icon')
-        icon_box.append(emoji_label)
+        self.emoji_label = Gtk.Label()
+        self.emoji_label.add_css_class('event-icon')
+        icon_box.append(self.emoji_label)
         
         self.add_prefix(icon_box)
         
-        # Add CSS classes for styling
         self.add_css_class('event-row')
-        self.add_css_class(style['css_class'])
-        
-        # Highlight upcoming events (within 7 days)
-        if days_until <= 7:
-            self.add_css_class('upcoming-event')
-            if days_until == 0:
-                self.add_css_class('event-today')
         
         # Make row activatable
         self.set_activatable(True)
         
+    def bind(self, event_data: Event, upcoming_days: int = None):
+        """Show an event in this row, replacing whatever it showed before."""
+        if isinstance(event_data, dict):
+            event_data = Event.from_dict(event_data)
+        self.event_data = event_data
+        if upcoming_days is not None:
+            self.upcoming_days = upcoming_days
+        
+        event = event_data
+        name = event.name or 'Unknown'
+        days_until = event.days_until or 0
+        event_type = event.event_type or EVENT_TYPE_BIRTHDAY
+        anniversary_type = event.anniversary_type
+        
+        # Get style for this event type (with name for holiday detection)
+        if self._style is not None:
+            self.remove_css_class(self._style['css_class'])
+        style = get_event_style(event_type, anniversary_type, name)
+        self._style = style
+        self.add_css_class(style['css_class'])
+        self.emoji_label.set_label(style['emoji'])
+        
+        self.set_title(name)
+        self.update_labels()
+        
+        self.special_label.set_visible(event.day == 31 and event.month == 8)
+        
+        self.fire_label.set_visible(is_fire_easter_egg(name))
+        
+        self._update_upcoming_classes(days_until)
+        
+    def update_labels(self):
+        """Set the translated texts: date, days-until badge and year count.
+        
+        Also called on its own after a language change, so the row is
+        relabeled without being rebuilt.
+        """
+        event = self.event_data
+        days_until = event.days_until or 0
+        self.set_subtitle(format_event_date(event))
+        self.days_label.set_label(self._days_text(days_until))
+        years_text = self._years_text(days_until)
+        self.years_label.set_label(years_text or '')
+        self.years_label.set_visible(years_text is not None)
+        
+    def _years_text(self, days_until: int):
+        """Text for the year count of events with a year, or None."""
+        event = self.event_data
+        day = event.day
+        month = event.month
+        year = event.year
+        event_type = event.event_type or EVENT_TYPE_BIRTHDAY
+        if not year or event_type not in [EVENT_TYPE_BIRTHDAY, EVENT_TYPE_ANNIVERSARY]:
+            return None
+        
+        from datetime import date
+        today = date.today()
+        next_occurrence_year = today.year if days_until > 0 or (days_until == 0) else today.year
+        if days_until > 0:
+            # Check if the event is this year or next year
+            try:
+                this_year_date = date(today.year, month, day)
+                if this_year_date < today:
+                    next_occurrence_year = today.year + 1
+            except ValueError:
+                pass
+        
+        years_count = next_occurrence_year - year
+        if years_count <= 0:
+            return None
+        if event_type == EVENT_TYPE_BIRTHDAY:
+            return get_formatter('years_old')(years_count)
+        return get_formatter('anniversary_years')(years_count)
+        
+    def _days_text(self, days_until: int) -> str:
+        """Text for the days-until badge."""
+        if days_until == 0:
+            return _('today') + f" {self._style['emoji']}"
+        elif days_until == 1:
+            return _('tomorrow') + "!"
+        return get_formatter('days_left')(days_until)
+        
+    def _update_upcoming_classes(self, days_until: int):
+        """Highlight upcoming events (within notification_days)."""
+        upcoming = days_until <= self.upcoming_days
+        if upcoming:
+            self.add_css_class('upcoming-event')
+        else:
+            self.remove_css_class('upcoming-event')
+        if upcoming and days_until == 0:
+            self.add_css_class('event-today')
+        else:
+            self.remove_css_class('event-today')
+        
     def get_event_id(self) -> int:
         """Get the event ID."""
-        return self.event_data.get('id', 0)
+        return self.event_data.id or 0
     
     # Legacy support
     def get_birthday_id(self) -> int:
@@ -336,14 +415,14 @@ class EventRow(Adw.ActionRow):
     
     def get_notes(self) -> str:
         """Get the event notes."""
-        return self.event_data.get('notes', '')
+        return self.event_data.notes or ''
     
-    def get_event_data(self) -> dict:
+    def get_event_data(self) -> Event:
         """Get the full event data."""
         return self.event_data
     
     # Legacy support
-    def get_birthday_data(self) -> dict:
+    def get_birthday_data(self) -> Event:
         """Get the full event data (legacy support)."""
         return self.get_event_data()
 
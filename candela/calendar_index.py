@@ -0,0 +1,80 @@
+"""
+Calendar Index - Day-of-year buckets of event ids.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+# Slots follow a leap year, so Feb 29 has a bucket of its own
+SLOTS = 366
+FEB_29 = 59
+
+# Cumulative days before each month in a leap year (index 1 = January)
+_MONTH_OFFSETS = [0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335]
+_MONTH_LENGTHS = [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+# The furthest ahead any next occurrence can be
+MAX_DAYS_AHEAD = 365
+
+
+def day_slot(month: int, day: int) -> int:
+    """Bucket for a (month, day), clamping invalid dates like days_until_event does."""
+    if day > _MONTH_LENGTHS[month]:
+        day = 28
+    return _MONTH_OFFSETS[month] + day - 1
+
+
+class CalendarIndex:
+    """Maps each day of the year to the ids of the events falling on it.
+
+    "Which events are in the next N days" walks N + 1 buckets instead of
+    every event. In non-leap years Feb 29 events are reported on Feb 28,
+    the same fallback days_until_event uses.
+    """
+
+    def __init__(self):
+        self._buckets: List[Set[int]] = [set() for _ in range(SLOTS)]
+        self._slots: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def rebuild(self, dates: Iterable[Tuple[int, int, int]]):
+        """Replace the index contents from (id, month, day) tuples."""
+        for bucket in self._buckets:
+            bucket.clear()
+        self._slots.clear()
+        for event_id, month, day in dates:
+            self.add(event_id, month, day)
+
+    def add(self, event_id: int, month: int, day: int):
+        """Index an event, moving it if it was already indexed."""
+        self.remove(event_id)
+        slot = day_slot(month, day)
+        self._slots[event_id] = slot
+        self._buckets[slot].add(event_id)
+
+    def remove(self, event_id: int):
+        """Drop an event from the index."""
+        slot = self._slots.pop(event_id, None)
+        if slot is not None:
+            self._buckets[slot].discard(event_id)
+
+    def walk(self, today: date, within_days: int) -> Iterator[Tuple[int, Set[int]]]:
+        """Yield (days_until, ids) for each non-empty day from today to today + within_days."""
+        seen = set()
+        for offset in range(min(within_days, MAX_DAYS_AHEAD) + 1):
+            current = today + timedelta(days=offset)
+            slots = [_MONTH_OFFSETS[current.month] + current.day - 1]
+            # Feb 28 is followed by Mar 1 only in non-leap years
+            if current.month == 2 and current.day == 28 and (current + timedelta(days=1)).month == 3:
+                slots.append(FEB_29)
+            # A year-long walk reaches some dates twice; the first visit is the next occurrence
+            ids = set()
+            for slot in slots:
+                if slot not in seen:
+                    seen.add(slot)
+                    ids |= self._buckets[slot]
+            if ids:
+                yield offset, ids
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Command Line - Lists and edits events without GTK.
+
+Imports only the data layer and translations, so it starts in a few tens
+of milliseconds and works without a display (cron, scripts, SSH).
+"""
+
+import argparse
+import json
+import sys
+from datetime import date
+from typing import Iterable, List, Optional, TextIO, Tuple
+
+from data_manager import (DataManager, EVENT_TYPE_BIRTHDAY, EVENT_TYPE_ANNIVERSARY,
+                          EVENT_TYPE_SPECIAL, ANNIVERSARY_WEDDING, ANNIVERSARY_RELATIONSHIP,
+                          ANNIVERSARY_MEMORIAL, ANNIVERSARY_OTHER)
+from event_model import EVENT_FIELDS, Event
+from translations import _, format_event_date, set_language
+
+
+FORMAT_TEXT = 'text'
+FORMAT_JSON = 'json'
+FORMAT_TSV = 'tsv'
+
+# Columns of list and upcoming output, after the stored fields
+LISTING_FIELDS = EVENT_FIELDS + ('days_until',)
+
+
+def parse_date(text: str) -> Tuple[int, int, Optional[int]]:
+    """Parse YYYY-MM-DD, MM-DD, DD.MM.YYYY or DD.MM into (day, month, year)."""
+    try:
+        if '.' in text:
+            parts = [int(p) for p in text.split('.')]
+            day, month, year = (parts + [None])[:3] if len(parts) in (2, 3) else (0, 0, None)
+        else:
+            parts = [int(p) for p in text.split('-')]
+            if len(parts) == 3:
+                year, month, day = parts
+            elif len(parts) == 2:
+                (month, day), year = parts, None
+            else:
+                raise ValueError
+        # Validate in a leap year, so Feb 29 without a year is allowed
+        date(2000 if year is None else year, month, day)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date '{text}' (use YYYY-MM-DD, MM-DD, DD.MM.YYYY or DD.MM)")
+    return day, month, year
+
+
+def build_parser(app: bool = False) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    With app, it is the parser for `candela COMMAND`, handled by the running
+    application, which also has a show command.
+    """
+    parser = argparse.ArgumentParser(prog='candela' if app else 'candela-cli',
+                                     description='List and edit Candela events.')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    if app:
+        show = commands.add_parser('show', help='open the window, optionally on an event')
+        show.add_argument('id', type=int, nargs='?')
+
+    def add_format(command, default=FORMAT_TEXT):
+        choices = (FORMAT_JSON, FORMAT_TSV)
+        if default == FORMAT_TEXT:
+            choices = (FORMAT_TEXT,) + choices
+        command.add_argument('-f', '--format', choices=choices, default=default,
+                             help=f'output format (default: {default})')
+
+    add_format(commands.add_parser('list', help='all events, soonest first'))
+
+    upcoming = commands.add_parser('upcoming', help='events in the next days')
+    upcoming.add_argument('-d', '--days', type=int,
+                          help='how many days ahead (default: the reminder days setting)')
+    upcoming.add_argument('-n', '--limit', type=int, help='show at most this many events')
+    add_format(upcoming)
+
+    add = commands.add_parser('add', help='add an event')
+    add.add_argument('name')
+    add.add_argument('date', type=parse_date, help='YYYY-MM-DD, MM-DD, DD.MM.YYYY or DD.MM')
+    add.add_argument('-t', '--type', dest='event_type', default=EVENT_TYPE_BIRTHDAY,
+                     choices=(EVENT_TYPE_BIRTHDAY, EVENT_TYPE_ANNIVERSARY, EVENT_TYPE_SPECIAL))
+    add.add_argument('-a', '--anniversary-type',
+                     choices=(ANNIVERSARY_WEDDING, ANNIVERSARY_RELATIONSHIP,
+                              ANNIVERSARY_MEMORIAL, ANNIVERSARY_OTHER))
+    add.add_argument('--notes', default='')
+    add_format(add)
+
+    delete = commands.add_parser('delete', help='delete an event by id')
+    delete.add_argument('id', type=int)
+
+    export = commands.add_parser('export', help='every event in the events.json schema')
+    export.add_argument('-o', '--output', help='write to this file instead of standard output')
+    add_format(export, default=FORMAT_JSON)
+    return parser
+
+
+def _days_text(days_until: int) -> str:
+    if days_until == 0:
+        return _('today')
+    if days_until == 1:
+        return _('tomorrow')
+    return _('days_left').format(days_until)
+
+
+def _tsv_field(value) -> str:
+    """One TSV cell; tabs, newlines and backslashes are escaped."""
+    if value is None:
+        return ''
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def write_events(events: Iterable[Event], fmt: str, out: TextIO, fields=LISTING_FIELDS):
+    """Write events (or event dicts, except as text) as aligned text, a JSON
+    array or TSV with a header line."""
+    if fmt == FORMAT_JSON:
+        rows = [{field: event.get(field) for field in fields} for event in events]
+        json.dump(rows, out, ensure_ascii=False, indent=2)
+        out.write('\n')
+    elif fmt == FORMAT_TSV:
+        out.write('\t'.join(fields) + '\n')
+        for event in events:
+            out.write('\t'.join(_tsv_field(event.get(field)) for field in fields) + '\n')
+    else:
+        for event in events:
+            out.write(f"{event.id:>5}  {_days_text(event.days_until):<16}  "
+                      f"{format_event_date(event):<20}  {event.name}\n")
+
+
+def run(args: argparse.Namespace, data_manager: DataManager, out: TextIO = sys.stdout) -> int:
+    """Carry out a parsed command; returns the exit status."""
+    if args.command == 'list':
+        write_events(data_manager.get_sorted_events(), args.format, out)
+    elif args.command == 'upcoming':
+        days = data_manager.get_upcoming_days() if args.days is None else args.days
+        if args.limit is None:
+            events = data_manager.get_events_within(days)
+        else:
+            events = data_manager.get_upcoming(args.limit, days)
+        write_events(events, args.format, out)
+    elif args.command == 'add':
+        day, month, year = args.date
+        added = data_manager.add_event(args.name, day, month, year, args.notes,
+                                       args.event_type, args.anniversary_type)
+        if args.format == FORMAT_TEXT:
+            out.write(_('added_toast').format(name=args.name) + '\n')
+        else:
+            event = Event.from_dict(added)
+            event.days_until = DataManager.days_until_event(day, month)
+            write_events([event], args.format, out)
+    elif args.command == 'delete':
+        event = data_manager.get_event(args.id)
+        if event is None:
+            print(f"✗ No event with id {args.id}", file=sys.stderr)
+            return 1
+        data_manager.delete_event(args.id)
+        out.write(_('deleted_toast').format(name=event.get('name')) + '\n')
+    elif args.command == 'export':
+        events = data_manager.load_events()
+        # Keys outside the schema are exported too
+        fields: List[str] = list(EVENT_FIELDS)
+        for event in events:
+            fields.extend(key for key in event if key not in fields)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                write_events(events, args.format, f, fields)
+        else:
+            write_events(events, args.format, out, fields)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    data_manager = DataManager()
+    set_language(data_manager.settings['language'])
+    try:
+        return run(args, data_manager)
+    except BrokenPipeError:
+        # Output piped into head and the like
+        return 0
+    finally:
+        data_manager.flush()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
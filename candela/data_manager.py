@@ -4,9 +4,21 @@ Data Manager - Handles persistent storage of event data.
 
 import json
 import os
-from datetime import datetime, date
+import threading
+from array import array
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+from calendar_index import MAX_DAYS_AHEAD, CalendarIndex
+from event_model import Event
+from json_store import JsonEventStore
+from settings import Settings
+from startup_profile import phase
+from write_behind import WriteBehind
 
 
 # Event type constants
@@ -20,6 +32,63 @@ ANNIVERSARY_RELATIONSHIP = 'relationship'
 ANNIVERSARY_MEMORIAL = 'memorial'
 ANNIVERSARY_OTHER = 'other'
 
+# Storage backends, chosen by $CANDELA_STORAGE or the 'storage_backend' setting
+STORAGE_JSON = 'json'
+STORAGE_SQLITE = 'sqlite'
+
+# Kinds of change reported to change listeners
+CHANGE_ADDED = 'added'
+CHANGE_REMOVED = 'removed'
+CHANGE_UPDATED = 'updated'
+CHANGE_RESET = 'reset'
+
+
+def _days_until(today: date, day: int, month: int) -> int:
+    """Days from today until the next (day, month)."""
+    try:
+        this_year = date(today.year, month, day)
+    except ValueError:
+        # Handle invalid dates like Feb 30
+        this_year = date(today.year, month, min(day, 28))
+    
+    if this_year < today:
+        # Event already passed this year, calculate for next year
+        try:
+            next_year = date(today.year + 1, month, day)
+        except ValueError:
+            next_year = date(today.year + 1, month, min(day, 28))
+        return (next_year - today).days
+    else:
+        return (this_year - today).days
+
+
+@lru_cache(maxsize=4)
+def _days_until_table(today: date) -> array:
+    """Days until every calendar date, indexed by month * 32 + day.
+    
+    Built with the scalar rule (including the Feb 29 fallback) once per
+    day, so whole collections resolve with one table lookup per event.
+    """
+    table = array('H', bytes(2 * 13 * 32))
+    for month in range(1, 13):
+        for day in range(1, 32):
+            table[month * 32 + day] = _days_until(today, day, month)
+    return table
+
+
+class EventChange(NamedTuple):
+    """One change to the event collection, as seen by change listeners.
+    
+    Positions index the get_sorted_events() order: old_position is where the
+    event was before the change (None if added), new_position where it is
+    now (None if removed). A reset means the listing must be reloaded.
+    """
+    kind: str
+    event_id: Optional[int] = None
+    event: Optional[Event] = None
+    old_position: Optional[int] = None
+    new_position: Optional[int] = None
+
 
 class DataManager:
     """Manages event data storage and retrieval."""
@@ -31,16 +100,50 @@ class DataManager:
         self.data_file = self.data_dir / 'events.json'
         self.legacy_data_file = self.data_dir / 'birthdays.json'
         self.settings_file = self.data_dir / 'settings.json'
+        self.db_file = self.data_dir / 'events.db'
+        # Snapshot and settings writes are coalesced and made off-thread
+        self.writer = WriteBehind()
         self._ensure_data_dir()
-        self._migrate_legacy_data()
+        # Read once; windows subscribe to changes instead of re-reading
+        self.settings = Settings(self.settings_file, self.writer)
+        self.store = self._open_store()
+        # Day-of-year buckets for "next N days" queries, rebuilt whenever the
+        # store reports a new generation (reload or replace)
+        self.calendar = CalendarIndex()
+        self._calendar_generation = None
+        # Called with an EventChange after every add, update, delete or replace
+        self._change_listeners: List[Callable[[EventChange], None]] = []
+        self._listing_generation = None
+        # Cleared while a load_async() is reading the events
+        self._loaded = threading.Event()
+        self._loaded.set()
+        with phase('migration check'):
+            self._migrate_legacy_data()
         
     def _ensure_data_dir(self):
         """Create data directory if it doesn't exist."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+    def _open_store(self):
+        """Open the configured event store."""
+        json_store = JsonEventStore(self.data_file, self.writer)
+        backend = os.environ.get('CANDELA_STORAGE') or self.settings['storage_backend']
+        if backend != STORAGE_SQLITE:
+            return json_store
+        
+        from sqlite_store import SqliteEventStore
+        store = SqliteEventStore(self.db_file)
+        if store.is_new and not json_store.is_new:
+            # One-shot import of the existing events.json (plus journal)
+            json_store.refresh()
+            # Ids of deleted events stay retired
+            store.next_id = max(store.next_id, json_store.next_id)
+            store.replace([e.to_dict() for e in json_store.events()])
+        return store
+        
     def _migrate_legacy_data(self):
         """Migrate old birthdays.json to new events.json format."""
-        if self.legacy_data_file.exists() and not self.data_file.exists():
+        if self.legacy_data_file.exists() and self.store.is_new:
             try:
                 with open(self.legacy_data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -68,15 +171,14 @@ class DataManager:
         
     def load_events(self) -> List[Dict]:
         """Load all events from storage."""
-        if not self.data_file.exists():
-            return []
-        
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('events', [])
-        except (json.JSONDecodeError, IOError):
-            return []
+        self.store.refresh()
+        return [e.to_dict() for e in self.store.events()]
+    
+    def get_event(self, event_id: int) -> Optional[Dict]:
+        """Get a single event by ID."""
+        self.store.refresh()
+        event = self.store.get(event_id)
+        return event.to_dict() if event is not None else None
     
     # Legacy support
     def load_birthdays(self) -> List[Dict]:
@@ -85,38 +187,103 @@ class DataManager:
     
     def save_events(self, events: List[Dict]):
         """Save events to storage."""
-        try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump({'events': events}, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            print(f"Error saving events: {e}")
+        self.store.replace([dict(e) for e in events])
+        self._notify(EventChange(CHANGE_RESET))
+    
+    def flush(self):
+        """Write out everything still pending; call before exiting."""
+        self.writer.flush()
+        
+    def set_error_handler(self, callback: Optional[Callable[[Exception], None]]):
+        """Report failed background writes to callback, called on the writer thread."""
+        self.writer.on_error = callback
+        
+    def load_async(self, callback: Callable[[], None]):
+        """Read the events from disk on the writer thread, then call callback there.
+        
+        Queries made after the callback find everything in memory.
+        """
+        self._loaded.clear()
+        
+        def load():
+            try:
+                self._sync_calendar()
+            finally:
+                self._loaded.set()
+                callback()
+        self.writer.submit(load)
+    
+    def refresh(self) -> int:
+        """Pick up changes other processes made to the events.
+        
+        Returns the store generation, which moves whenever the events were
+        reloaded or replaced; this process's own writes leave it alone.
+        """
+        self.store.refresh()
+        return self.store.generation
+    
+    def wait_loaded(self):
+        """Block until a load started by load_async() has read the events."""
+        self._loaded.wait()
     
     # Legacy support
     def save_birthdays(self, birthdays: List[Dict]):
         """Save events (legacy support)."""
         self.save_events(birthdays)
     
+    def add_change_listener(self, callback: Callable[[EventChange], None]):
+        """Call callback with an EventChange whenever the events change."""
+        self._change_listeners.append(callback)
+        
+    def remove_change_listener(self, callback: Callable[[EventChange], None]):
+        """Stop calling a callback registered with add_change_listener."""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+            
+    def _notify(self, change: EventChange):
+        """Tell every change listener about a change."""
+        if self.store.generation != self._listing_generation:
+            # Reloaded from disk since the listing was read; positions are meaningless
+            change = EventChange(CHANGE_RESET)
+        for callback in list(self._change_listeners):
+            callback(change)
+            
+    def _sorted_position(self, event: Event) -> Optional[int]:
+        """Where event falls in the get_sorted_events() order; fills its days_until.
+        
+        Only counts the events sorting before it, one table lookup each, so
+        no event records are built and nothing is sorted.
+        """
+        if event is None:
+            return None
+        table = _days_until_table(date.today())
+        event.days_until = table[event.month * 32 + event.day]
+        key = (event.days_until, event.id)
+        return sum(1 for event_id, month, day in self.store.dates()
+                   if (table[month * 32 + day], event_id) < key)
+        
     def add_event(self, name: str, day: int, month: int, year: Optional[int] = None, 
                   notes: str = "", event_type: str = EVENT_TYPE_BIRTHDAY,
                   anniversary_type: Optional[str] = None) -> Dict:
         """Add a new event."""
-        events = self.load_events()
-        
-        new_event = {
-            'id': self._generate_id(events),
-            'name': name,
-            'day': day,
-            'month': month,
-            'year': year,
-            'notes': notes,
-            'event_type': event_type,
-            'anniversary_type': anniversary_type,
-            'created_at': datetime.now().isoformat()
-        }
-        
-        events.append(new_event)
-        self.save_events(events)
-        return new_event
+        self.store.refresh()
+        
+        with self.store.lock:
+            new_event = self.store.add({
+                'name': name,
+                'day': day,
+                'month': month,
+                'year': year,
+                'notes': notes,
+                'event_type': event_type,
+                'anniversary_type': anniversary_type,
+                'created_at': datetime.now().isoformat()
+            })
+            self.calendar.add(new_event.id, month, day)
+        if self._change_listeners:
+            self._notify(EventChange(CHANGE_ADDED, new_event.id, new_event,
+                                     new_position=self._sorted_position(new_event)))
+        return new_event.to_dict()
     
     # Legacy support
     def add_birthday(self, name: str, day: int, month: int, year: Optional[int] = None, notes: str = "") -> Dict:
@@ -125,9 +292,15 @@ class DataManager:
     
     def delete_event(self, event_id: int):
         """Delete an event by ID."""
-        events = self.load_events()
-        events = [e for e in events if e.get('id') != event_id]
-        self.save_events(events)
+        self.store.refresh()
+        old_position = None
+        if self._change_listeners:
+            old_position = self._sorted_position(self.store.get(event_id))
+        with self.store.lock:
+            deleted = self.store.delete(event_id)
+            self.calendar.remove(event_id)
+        if deleted and self._change_listeners:
+            self._notify(EventChange(CHANGE_REMOVED, event_id, old_position=old_position))
     
     # Legacy support
     def delete_birthday(self, birthday_id: int):
@@ -136,43 +309,37 @@ class DataManager:
     
     def update_event(self, event_id: int, **kwargs):
         """Update an event."""
-        events = self.load_events()
-        for event in events:
-            if event.get('id') == event_id:
-                event.update(kwargs)
-                break
-        self.save_events(events)
+        self.store.refresh()
+        kwargs.pop('id', None)  # ids are immutable, the index is keyed by them
+        old_position = None
+        if self._change_listeners:
+            old_position = self._sorted_position(self.store.get(event_id))
+        with self.store.lock:
+            if not self.store.update(event_id, kwargs):
+                return
+            event = self.store.get(event_id)
+            if 'day' in kwargs or 'month' in kwargs:
+                self.calendar.add(event_id, event.month, event.day)
+        if self._change_listeners:
+            self._notify(EventChange(CHANGE_UPDATED, event_id, event, old_position,
+                                     self._sorted_position(event)))
     
     # Legacy support
     def update_birthday(self, birthday_id: int, **kwargs):
         """Update an event (legacy support)."""
         self.update_event(birthday_id, **kwargs)
     
-    def _generate_id(self, events: List[Dict]) -> int:
-        """Generate a unique ID for a new event."""
-        if not events:
-            return 1
-        return max(e.get('id', 0) for e in events) + 1
-    
     @staticmethod
     def days_until_event(day: int, month: int) -> int:
         """Calculate days until the next occurrence of an event."""
-        today = date.today()
-        try:
-            this_year = date(today.year, month, day)
-        except ValueError:
-            # Handle invalid dates like Feb 30
-            this_year = date(today.year, month, min(day, 28))
-        
-        if this_year < today:
-            # Event already passed this year, calculate for next year
-            try:
-                next_year = date(today.year + 1, month, day)
-            except ValueError:
-                next_year = date(today.year + 1, month, min(day, 28))
-            return (next_year - today).days
-        else:
-            return (this_year - today).days
+        return _days_until(date.today(), day, month)
+    
+    @staticmethod
+    def days_until_events(days: Sequence[int], months: Sequence[int],
+                          today: Optional[date] = None) -> array:
+        """Calculate days until the next occurrence for whole day/month columns at once."""
+        table = _days_until_table(today or date.today())
+        return array('H', [table[m * 32 + d] for d, m in zip(days, months)])
     
     # Legacy support
     @staticmethod
@@ -186,41 +353,140 @@ class DataManager:
         days = DataManager.days_until_event(day, month)
         return days <= days_threshold
     
-    def get_sorted_events(self) -> List[Dict]:
-        """Get events sorted by days until next occurrence."""
-        events = self.load_events()
+    def _with_days_until(self, events) -> List[Event]:
+        """Fill the cached days_until of each record and sort by it."""
+        events = list(events)
+        table = _days_until_table(date.today())
         for e in events:
-            e['days_until'] = self.days_until_event(e['day'], e['month'])
-        return sorted(events, key=lambda x: x['days_until'])
+            e.days_until = table[e.month * 32 + e.day]
+        # Ties break on id, the same order the calendar walk uses
+        events.sort(key=attrgetter('days_until', 'id'))
+        return events
+    
+    @staticmethod
+    def shift_days_until(events: List[Event], days_passed: int = 1) -> List[Event]:
+        """Refresh cached days_until values after the date moved days_passed ahead.
+        
+        Each count is looked up for today rather than decremented, since
+        the records are shared and may have been refreshed already. Returns
+        the events whose occurrence has passed meanwhile, now a year away;
+        the others all moved days_passed closer and keep their order.
+        """
+        today = date.today()
+        table = _days_until_table(today)
+        before = _days_until_table(today - timedelta(days=days_passed))
+        wrapped = []
+        for e in events:
+            slot = e.month * 32 + e.day
+            e.days_until = table[slot]
+            if before[slot] < days_passed:
+                wrapped.append(e)
+        return wrapped
+    
+    def _sync_calendar(self):
+        """Rebuild the calendar index if the store was reloaded or replaced.
+        
+        Also runs on the writer thread (load_async), so it holds the store
+        lock, which mutations take around their calendar updates too.
+        """
+        with self.store.lock:
+            self.store.refresh()
+            if self._calendar_generation != self.store.generation:
+                self.calendar.rebuild(self.store.dates())
+                self._calendar_generation = self.store.generation
+    
+    def _iter_upcoming_ids(self, within_days: int) -> Iterator[Tuple[int, int]]:
+        """Yield (days_until, id) soonest first by walking the calendar index lazily."""
+        self._sync_calendar()
+        for days_until, ids in self.calendar.walk(date.today(), within_days):
+            for event_id in sorted(ids):
+                yield days_until, event_id
+    
+    def _iter_upcoming(self, within_days: int, offset: int = 0,
+                       limit: Optional[int] = None) -> Iterator[Event]:
+        """Yield events soonest first, skipping offset and stopping after limit.
+        
+        Skipped events are never fetched from the store.
+        """
+        stop = None if limit is None else offset + limit
+        for days_until, event_id in islice(self._iter_upcoming_ids(within_days), offset, stop):
+            event = self.store.get(event_id)
+            event.days_until = days_until
+            yield event
+    
+    def walk_calendar(self, start: date, within_days: int = MAX_DAYS_AHEAD) -> Iterator[Tuple[int, List[Event]]]:
+        """Yield (days after start, events) for each day with events, from start on.
+        
+        Lazy, so callers looking for the next matching day stop early.
+        """
+        self._sync_calendar()
+        for days_ahead, ids in self.calendar.walk(start, within_days):
+            yield days_ahead, [self.store.get(event_id) for event_id in sorted(ids)]
+    
+    def get_sorted_events(self, offset: int = 0, limit: Optional[int] = None) -> List[Event]:
+        """Get events sorted by days until next occurrence.
+        
+        With a limit, returns one page without sorting the whole
+        collection. Returns the store's Event records (read them like
+        dicts); change events through update_event rather than by
+        mutating them.
+        """
+        if limit is None:
+            self.store.refresh()
+            # Change listeners get positions relative to this listing
+            self._listing_generation = self.store.generation
+            return self._with_days_until(self.store.events())[offset:]
+        return list(self._iter_upcoming(MAX_DAYS_AHEAD, offset, limit))
+    
+    def iter_sorted_events(self) -> Iterator[Event]:
+        """Yield every event in get_sorted_events() order, lazily.
+        
+        For filling a view piece by piece; change listeners get positions
+        relative to this listing. Stop iterating once the events change.
+        """
+        self._sync_calendar()
+        self._listing_generation = self.store.generation
+        return self._iter_upcoming(MAX_DAYS_AHEAD)
+    
+    def get_upcoming(self, limit: int, within_days: Optional[int] = None) -> List[Event]:
+        """Get at most limit events, soonest first, optionally only those within_days ahead.
+        
+        Stops walking the calendar index as soon as limit events are found.
+        """
+        if within_days is None:
+            within_days = MAX_DAYS_AHEAD
+        return list(self._iter_upcoming(within_days, limit=limit))
+    
+    def get_upcoming_days(self) -> int:
+        """How many days ahead counts as upcoming (the notification_days setting)."""
+        return self.settings['notification_days']
+    
+    def get_events_within(self, within_days: Optional[int] = None) -> List[Event]:
+        """Get events occurring in the next within_days days, soonest first.
+        
+        Walks only the calendar buckets in range. Defaults to the
+        notification_days setting.
+        """
+        if within_days is None:
+            within_days = self.get_upcoming_days()
+        return list(self._iter_upcoming(within_days))
+    
+    def get_events_in_month(self, month: int) -> List[Event]:
+        """Get the events in a month, ordered by day."""
+        self.store.refresh()
+        return self.store.in_month(month)
     
     # Legacy support
-    def get_sorted_birthdays(self) -> List[Dict]:
+    def get_sorted_birthdays(self) -> List[Event]:
         """Get sorted events (legacy support)."""
         return self.get_sorted_events()
     
-    # Settings management
+    # Legacy support
     def load_settings(self) -> Dict:
-        """Load application settings."""
-        default_settings = {
-            'theme': 'system',  # 'system', 'light', 'dark'
-            'notifications_enabled': True,
-            'notification_days': 7
-        }
-        
-        if not self.settings_file.exists():
-            return default_settings
-        
-        try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                return {**default_settings, **settings}
-        except (json.JSONDecodeError, IOError):
-            return default_settings
+        """Load application settings (legacy support, see self.settings)."""
+        return self.settings.as_dict()
     
+    # Legacy support
     def save_settings(self, settings: Dict):
-        """Save application settings."""
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            print(f"Error saving settings: {e}")
+        """Save application settings (legacy support, see self.settings)."""
+        self.settings.update(settings)
@@ -0,0 +1,102 @@
+"""
+Event Model - Compact in-memory event record.
+"""
+
+import sys
+from typing import Dict, Optional
+
+
+# Persisted fields, in the order they appear in events.json
+EVENT_FIELDS = ('id', 'name', 'day', 'month', 'year', 'notes',
+                'event_type', 'anniversary_type', 'created_at')
+
+_FIELD_SET = frozenset(EVENT_FIELDS)
+
+
+def _intern(value):
+    """Share one copy of repeated type strings across all events."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Event:
+    """A single event stored in __slots__ instead of a per-event dict.
+
+    Reads like the dicts it replaces (get, [], in), so rows and dialogs
+    can keep using event_data.get('name'). days_until is a cached value
+    filled in by DataManager and is never persisted. Keys outside the
+    schema are kept in extra so files round-trip unchanged.
+    """
+
+    __slots__ = EVENT_FIELDS + ('extra', 'days_until')
+
+    def __init__(self, id: Optional[int] = None, name: str = '', day: int = 1, month: int = 1,
+                 year: Optional[int] = None, notes: str = '', event_type: Optional[str] = None,
+                 anniversary_type: Optional[str] = None, created_at: Optional[str] = None,
+                 extra: Optional[Dict] = None):
+        self.id = id
+        self.name = name
+        self.day = day
+        self.month = month
+        self.year = year
+        self.notes = notes
+        self.event_type = _intern(event_type)
+        self.anniversary_type = _intern(anniversary_type)
+        self.created_at = created_at
+        self.extra = extra
+        self.days_until = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Event':
+        """Build an event from its events.json representation."""
+        event = cls()
+        event.update(data)
+        return event
+
+    def to_dict(self) -> Dict:
+        """Serialize to the events.json schema."""
+        data = {field: getattr(self, field) for field in EVENT_FIELDS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def update(self, fields: Dict):
+        """Set several fields at once, like dict.update."""
+        for key, value in fields.items():
+            if key in _FIELD_SET:
+                if key in ('event_type', 'anniversary_type'):
+                    value = _intern(value)
+                setattr(self, key, value)
+            elif key == 'days_until':
+                self.days_until = value
+            else:
+                if self.extra is None:
+                    self.extra = {}
+                self.extra[key] = value
+
+    def copy(self) -> 'Event':
+        """Return an independent copy, including the cached days_until."""
+        event = Event.from_dict(self.to_dict())
+        event.days_until = self.days_until
+        return event
+
+    def get(self, key: str, default=None):
+        """Look up a field by name, like dict.get."""
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if key == 'days_until':
+            return default if self.days_until is None else self.days_until
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, KeyError) is not KeyError
+
+    def __repr__(self) -> str:
+        return f"Event({self.to_dict()!r})"
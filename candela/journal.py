@@ -0,0 +1,107 @@
+"""
+Journal - Append-only log of event mutations stored next to events.json.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return an (inode, size, mtime) stamp for a file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class EventJournal:
+    """Line-delimited JSON log of add/update/delete records.
+
+    Every record carries a sequence number. A snapshot remembers the last
+    sequence number folded into it, so replay skips anything older and a
+    crash in the middle of compaction never applies a record twice.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # The live journal is moved here while a compaction is running
+        self.rotated_path = path.with_name(path.name + '.old')
+        self.seq = 0
+        # Records encoded since the last compaction; reset by the compacting store
+        self.entries = 0
+
+    def append(self, record: Dict) -> int:
+        """Append a record and return its sequence number."""
+        self.write([self.encode(record)])
+        return self.seq
+
+    def encode(self, record: Dict) -> str:
+        """Number a record and return its line, for writing later with write()."""
+        self.seq += 1
+        self.entries += 1
+        return json.dumps({'seq': self.seq, **record}, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    def write(self, lines: List[str]):
+        """Append lines from encode(), in the order they were encoded."""
+        data = ''.join(lines).encode('utf-8')
+        with open(self.path, 'ab+') as f:
+            if f.tell():
+                # Don't glue onto the torn end of a failed append
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            f.write(data)
+
+    def read(self, after_seq: int = 0) -> Iterator[Dict]:
+        """Yield records newer than after_seq, oldest first."""
+        self.seq = after_seq
+        self.entries = 0
+        for path in (self.rotated_path, self.path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn line from an interrupted append
+                            continue
+                        seq = record.get('seq', 0)
+                        if seq <= after_seq:
+                            continue
+                        self.seq = max(self.seq, seq)
+                        self.entries += 1
+                        yield record
+            except IOError:
+                continue
+
+    def rotate(self):
+        """Move the live journal aside so new records start a fresh file."""
+        if not self.path.exists():
+            return
+        if self.rotated_path.exists():
+            # A previous compaction never finished; keep its records too
+            import shutil
+            with open(self.rotated_path, 'rb+') as dst, open(self.path, 'rb') as src:
+                dst.seek(0, os.SEEK_END)
+                if dst.tell():
+                    dst.seek(-1, os.SEEK_END)
+                    if dst.read(1) != b'\n':
+                        dst.write(b'\n')
+                shutil.copyfileobj(src, dst)
+            os.unlink(self.path)
+        else:
+            os.replace(self.path, self.rotated_path)
+
+    def discard_rotated(self):
+        """Drop the rotated journal once its records are in a snapshot."""
+        try:
+            os.unlink(self.rotated_path)
+        except FileNotFoundError:
+            pass
+
+    def stat(self):
+        """Return an (inode, size, mtime) stamp for the live journal, or None."""
+        return file_stamp(self.path)
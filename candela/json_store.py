@@ -0,0 +1,304 @@
+"""
+JSON Store - events.json snapshot plus append-only journal.
+"""
+
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from event_model import Event
+from journal import EventJournal, file_stamp
+from write_behind import WriteBehind, atomic_write_text, sync_dir, write_temp_text
+
+
+# Fold the journal into events.json once it holds this many records, or as
+# many records as there are events, whichever is larger. That keeps the
+# amortized write cost per mutation constant.
+COMPACT_MIN_ENTRIES = 256
+
+
+class JsonEventStore:
+    """Event store backed by events.json and events.journal.
+
+    The in-memory copy is authoritative and is re-read only when the files'
+    (inode, size, mtime) stamps differ from the ones this process last read
+    or wrote. It is keyed by id; dict insertion order preserves the on-disk
+    list order.
+    
+    Other processes (e.g. the command line tool) share the files, so every
+    mutation takes an flock on events.lock, catches up on outside changes,
+    appends its journal line and records the stamps it left behind. Any
+    other stamp is then somebody else's write. Snapshots are written by the
+    writer thread and only the final rename happens under the lock.
+    """
+
+    def __init__(self, data_file: Path, writer: WriteBehind):
+        self.data_file = data_file
+        self.writer = writer
+        # Mutations are appended here and periodically folded into events.json
+        self.journal = EventJournal(data_file.with_name('events.journal'))
+        # Not the journal itself, which is renamed by compaction
+        self.lock_path = data_file.with_name('events.lock')
+        self.next_id = 1
+        # Bumped whenever the whole store is reloaded or replaced
+        self.generation = 0
+        self._events: Dict[int, Event] = {}
+        # Stamps of events.json and both journals as last read or written here
+        self._file_stamp = None
+        # journal_seq of the events.json on disk, as far as we know
+        self._snapshot_seq = 0
+        self._lock = threading.RLock()
+        self._lock_fd = None
+        self._lock_depth = 0
+
+    @property
+    def is_new(self) -> bool:
+        """True if nothing has been persisted yet."""
+        return not self.data_file.exists() and not self.journal.path.exists()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Guards the in-memory events; hold it to read them from another thread."""
+        return self._lock
+
+    def _stat_files(self):
+        """Return stamps for events.json, the rotated journal and the live journal."""
+        return (file_stamp(self.data_file), file_stamp(self.journal.rotated_path),
+                self.journal.stat())
+
+    @contextmanager
+    def _locked(self):
+        """Hold the store lock and an exclusive flock shared with other processes."""
+        with self._lock:
+            if self._lock_depth == 0:
+                if self._lock_fd is None:
+                    self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _read_snapshot(self) -> Dict:
+        """Parse events.json from disk."""
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _set_events(self, events: Iterable[Dict], next_id: int = 1):
+        """Replace the store and rebuild the id index."""
+        self._events = {}
+        self.next_id = next_id
+        self.generation += 1
+        for data in events:
+            event = Event.from_dict(data)
+            if event.id is None:
+                event.id = self.allocate_id()
+            else:
+                self.next_id = max(self.next_id, event.id + 1)
+            self._events[event.id] = event
+
+    def refresh(self):
+        """Reload from disk if the files changed outside this process."""
+        with self._lock:
+            if self._stat_files() == self._file_stamp:
+                return
+            with self._locked():
+                self._reload_if_changed()
+
+    def _reload_if_changed(self):
+        """Re-read everything unless the files are as we left them. Call with _locked()."""
+        stamp = self._stat_files()
+        if stamp == self._file_stamp:
+            return
+        # Every mutation is in the journal before its call returns, so
+        # memory holds nothing the files don't
+        data = self._read_snapshot() if stamp[0] else {}
+        self._snapshot_seq = data.get('journal_seq', 0)
+        self._set_events(data.get('events', []), data.get('next_id', 1))
+        for record in self.journal.read(self._snapshot_seq):
+            self._apply(record)
+        self._file_stamp = stamp
+
+    def _apply(self, record: Dict):
+        """Apply one journal record to the in-memory store."""
+        op = record.get('op')
+        if op == 'add':
+            event = Event.from_dict(record['event'])
+            self._events[event.id] = event
+            self.next_id = max(self.next_id, event.id + 1)
+        elif op == 'update':
+            event = self._events.get(record['id'])
+            if event is not None:
+                event.update(record['fields'])
+        elif op == 'delete':
+            self._events.pop(record['id'], None)
+
+    def _commit(self, record: Dict):
+        """Append a mutation to the journal, then apply it in memory.
+
+        Call with _locked() held, after _reload_if_changed(), so the
+        stamps afterwards are exactly the ones our append produced. If
+        the append fails, memory is left as it was and the OSError
+        propagates to the caller.
+        """
+        seq, entries = self.journal.seq, self.journal.entries
+        try:
+            self.journal.append(record)
+        except OSError:
+            self.journal.seq, self.journal.entries = seq, entries
+            # A partial line may have landed; re-read before the next mutation
+            self._file_stamp = None
+            raise
+        self._apply(record)
+        self._file_stamp = self._stat_files()
+        if self.journal.entries >= max(COMPACT_MIN_ENTRIES, len(self._events)):
+            try:
+                self._compact()
+            except OSError as e:
+                # The mutation itself is saved; compaction is retried on the next one
+                print(f"✗ Error compacting events: {e}")
+
+    def allocate_id(self) -> int:
+        """Hand out the next id; ids are never reused after a delete."""
+        event_id = self.next_id
+        self.next_id += 1
+        return event_id
+
+    def events(self) -> Iterable[Event]:
+        """Iterate over the stored events in insertion order."""
+        return self._events.values()
+
+    def dates(self) -> Iterable[Tuple[int, int, int]]:
+        """Iterate over (id, month, day) of every event."""
+        return ((e.id, e.month, e.day) for e in self._events.values())
+
+    def get(self, event_id: int) -> Optional[Event]:
+        """Return the stored event with this id, or None."""
+        return self._events.get(event_id)
+
+    def add(self, event: Dict) -> Event:
+        """Store a new event, assigning its id."""
+        with self._locked():
+            # Another process may have taken the next id
+            self._reload_if_changed()
+            event_id = self.allocate_id()
+            try:
+                self._commit({'op': 'add', 'event': {'id': event_id, **event}})
+            except OSError:
+                self.next_id = event_id
+                raise
+            return self._events[event_id]
+
+    def update(self, event_id: int, fields: Dict) -> bool:
+        """Update fields of an event; returns False if it doesn't exist."""
+        with self._locked():
+            self._reload_if_changed()
+            if event_id not in self._events:
+                return False
+            self._commit({'op': 'update', 'id': event_id, 'fields': fields})
+            return True
+
+    def delete(self, event_id: int) -> bool:
+        """Delete an event; returns False if it doesn't exist."""
+        with self._locked():
+            self._reload_if_changed()
+            if event_id not in self._events:
+                return False
+            self._commit({'op': 'delete', 'id': event_id})
+            return True
+
+    def replace(self, events: List[Dict]):
+        """Replace every event and write a fresh snapshot before returning.
+
+        A replace has no journal record to order it against other writers,
+        so its snapshot is written under the lock. Only imports and
+        save_events() replace.
+        """
+        with self._locked():
+            # Learn the latest sequence number, so the snapshot supersedes every record
+            self._reload_if_changed()
+            self._set_events(events, self.next_id)
+            self.journal.rotate()
+            self.journal.entries = 0
+            atomic_write_text(self.data_file, self._snapshot_text())
+            self.journal.discard_rotated()
+            self._snapshot_seq = self.journal.seq
+            self._file_stamp = self._stat_files()
+
+    def in_month(self, month: int) -> List[Event]:
+        """Events in the given month, ordered by day."""
+        return sorted((e for e in self._events.values() if e.month == month),
+                      key=lambda e: e.day)
+
+    def compact(self):
+        """Fold the journal into a fresh events.json snapshot."""
+        with self._locked():
+            self._reload_if_changed()
+            self._compact()
+
+    def _compact(self):
+        """Rotate the journal aside and queue the snapshot that replaces it.
+
+        Call with _locked() held and memory in step with the files. New
+        records go to a fresh journal while the writer thread writes the
+        snapshot.
+        """
+        self.journal.rotate()
+        self.journal.entries = 0
+        self._file_stamp = self._stat_files()
+        rotated = self._file_stamp[1]
+        seq = self.journal.seq
+        text = self._snapshot_text()
+        self.writer.schedule('events', lambda: self._write_snapshot(text, seq, rotated))
+
+    def _snapshot_text(self) -> str:
+        """Serialize the store as events.json, covering the journal up to its last record."""
+        return json.dumps({
+            'next_id': self.next_id,
+            'journal_seq': self.journal.seq,
+            'events': [e.to_dict() for e in self._events.values()],
+        }, ensure_ascii=False, indent=2)
+
+    def _write_snapshot(self, text: str, seq: int, rotated):
+        """Write events.json atomically and drop the rotated journal it supersedes.
+
+        The temp file is written and fsynced without the lock. The rename
+        is skipped if events.json was replaced by somebody else meanwhile
+        or already holds a newer snapshot of ours, and the rotated journal
+        is only deleted if nobody added records to it since we rotated; in
+        both cases replay still finds every record.
+        """
+        tmp_path = write_temp_text(self.data_file, text)
+        with self._locked():
+            stamp = self._stat_files()
+            if stamp[0] != self._file_stamp[0] or seq <= self._snapshot_seq:
+                os.unlink(tmp_path)
+                return
+            os.replace(tmp_path, self.data_file)
+            self._snapshot_seq = seq
+            if stamp[1] == rotated:
+                self.journal.discard_rotated()
+            if stamp == self._file_stamp:
+                self._file_stamp = self._stat_files()
+            # Otherwise another process wrote too; the next refresh re-reads
+        sync_dir(self.data_file.parent)
+
+    def close(self):
+        """Close the lock file. A snapshot the writer still runs reopens it."""
+        with self._lock:
+            if self._lock_fd is not None and not self._lock_depth:
+                os.close(self._lock_fd)
+                self._lock_fd = None
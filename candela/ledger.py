@@ -0,0 +1,109 @@
+"""
+Ledger - Append-only record of the reminders already sent.
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+from write_behind import WriteBehind, atomic_write_text
+
+
+# Rewrite the ledger once this many of its lines are for past occurrences,
+# or as many as are still live, whichever is larger
+COMPACT_MIN_STALE = 256
+
+# (event id, occurrence year, days before the occurrence)
+ReminderKey = Tuple[int, int, int]
+
+
+class NotificationLedger:
+    """Remembers which reminders went out, so restarts never repeat one.
+
+    One line per reminder: [id, year, days before, occurrence date]. Lookups
+    use an in-memory set. Once an occurrence has passed none of its
+    reminders can be due again, so compaction rewrites the file without
+    those lines. Appends and rewrites run in order on the writer thread.
+    """
+
+    def __init__(self, path: Path, writer: WriteBehind):
+        self.path = path
+        self.writer = writer
+        self._sent: Set[ReminderKey] = set()
+        # Occurrence date of each sent reminder, for pruning
+        self._dates: Dict[ReminderKey, date] = {}
+        # Lines in the file for occurrences that have passed
+        self._stale = 0
+        self._pruned_on = None
+
+    def __contains__(self, key: ReminderKey) -> bool:
+        return key in self._sent
+
+    def __len__(self) -> int:
+        return len(self._sent)
+
+    def load(self, today: date):
+        """Read the ledger, keeping only reminders for occurrences from today on."""
+        self._sent.clear()
+        self._dates.clear()
+        self._stale = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event_id, year, days_before, occurrence = json.loads(line)
+                        occurrence = date.fromisoformat(occurrence)
+                    except (ValueError, TypeError):
+                        # Torn line from an interrupted append
+                        continue
+                    key = (event_id, year, days_before)
+                    if occurrence < today or key in self._sent:
+                        self._stale += 1
+                        continue
+                    self._sent.add(key)
+                    self._dates[key] = occurrence
+        except IOError:
+            pass
+        self._pruned_on = today
+        self._compact_if_needed()
+
+    def record(self, reminders: Iterable[Tuple[ReminderKey, date]]):
+        """Remember sent reminders, given as (key, occurrence date), with one append."""
+        lines = []
+        for key, occurrence in reminders:
+            if key in self._sent:
+                continue
+            self._sent.add(key)
+            self._dates[key] = occurrence
+            lines.append(json.dumps([*key, occurrence.isoformat()]) + '\n')
+        if lines:
+            self.writer.submit(lambda: self._append(lines))
+
+    def _append(self, lines):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+
+    def prune(self, today: date):
+        """Forget reminders for occurrences before today; at most once a day."""
+        if self._pruned_on == today:
+            return
+        self._pruned_on = today
+        past = [key for key, occurrence in self._dates.items() if occurrence < today]
+        for key in past:
+            self._sent.discard(key)
+            del self._dates[key]
+        self._stale += len(past)
+        self._compact_if_needed()
+
+    def _compact_if_needed(self):
+        if self._stale >= max(COMPACT_MIN_STALE, len(self._sent)):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the ledger with only the live reminders."""
+        text = ''.join(json.dumps([*key, occurrence.isoformat()]) + '\n'
+                       for key, occurrence in self._dates.items())
+        self._stale = 0
+        # Queued behind any pending appends, which it already includes
+        self.writer.submit(lambda: atomic_write_text(self.path, text))
@@ -0,0 +1,46 @@
+"""
+Listing - Applies event changes to the two sections of the sorted list.
+"""
+
+from typing import Callable
+
+from data_manager import EventChange
+from event_model import Event
+
+
+def apply_change(upcoming_store, events_store, change: EventChange, upcoming_days: int,
+                 make_item: Callable[[Event], object]):
+    """Apply one add, update or delete with the minimal list model edits.
+
+    The stores (Gio.ListStore or anything with get_n_items, splice, insert
+    and remove) hold the sorted listing split at upcoming_days, and change
+    positions index that listing, so each change touches a single item:
+    one insert, one remove, or one splice or remove plus insert for an
+    update. make_item builds the item for an added or updated event, at
+    most once per change.
+    """
+    n_upcoming = upcoming_store.get_n_items()
+    removed_from = None
+    if change.old_position is not None:
+        if change.old_position < n_upcoming:
+            removed_from, index = upcoming_store, change.old_position
+        else:
+            removed_from, index = events_store, change.old_position - n_upcoming
+
+    if change.new_position is not None:
+        item = make_item(change.event)
+        if change.event.days_until <= upcoming_days:
+            store, position = upcoming_store, change.new_position
+        else:
+            store, position = events_store, change.new_position - n_upcoming
+            if removed_from is upcoming_store:
+                position += 1
+        if store is removed_from and position == index:
+            # Unmoved update: rebind just this row
+            store.splice(index, 1, [item])
+            return
+        if removed_from is not None:
+            removed_from.remove(index)
+        store.insert(position, item)
+    elif removed_from is not None:
+        removed_from.remove(index)
@@ -4,35 +4,99 @@ Candela - Birthday Reminder Application
 A GTK4 + Libadwaita application for tracking birthdays.
 """
 
+import io
 import sys
 import os
-import gi
+from contextlib import redirect_stderr, redirect_stdout
 
-gi.require_version('Gtk', '4.0')
-gi.require_version('Adw', '1')
+from startup_profile import phase
 
-from gi.repository import Gtk, Adw, Gio, Gdk
-
-from window import BirthdayWindow
+with phase('imports'):
+    import gi
+    
+    gi.require_version('Gtk', '4.0')
+    gi.require_version('Adw', '1')
+    
+    from gi.repository import Gtk, Adw, Gio, Gdk
+    
+    from data_manager import DataManager
+    from resources import RESOURCE_BASE_PATH, has_resource, register_resources
+    from translations import set_language
 
 
 class CandelaApp(Adw.Application):
     """Main application class."""
     
     def __init__(self):
+        # Must happen before startup, when Adw.Application loads style.css from it
+        register_resources()
         super().__init__(
             application_id='org.reend.candela',
-            flags=Gio.ApplicationFlags.DEFAULT_FLAGS
+            # `candela COMMAND ...` is forwarded to the running instance
+            flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE
         )
-        self.set_resource_base_path('/org/reend/candela')
+        self.set_resource_base_path(RESOURCE_BASE_PATH)
+        self.data_manager = None
+        self.settings = None
+        self.accent = None
+        self.reminders = None
+        self._command_parser = None
         
     def do_startup(self):
         Adw.Application.do_startup(self)
-        self._load_css()
+        # Shared by every window so pending writes can be flushed on shutdown
+        with phase('DataManager init'):
+            self.data_manager = DataManager()
+        # Loaded once; windows and preferences subscribe to its changes
+        self.settings = self.data_manager.settings
+        set_language(self.settings['language'])
         self._create_actions()
         
+        if self.get_flags() & Gio.ApplicationFlags.IS_SERVICE:
+            # Started with --gapplication-service: stay running for the
+            # reminders without building any widgets until activated
+            self._start_reminders()
+            self.hold()
+        
+    def _start_reminders(self):
+        """Start sending reminders, once.
+        
+        Only for the service and once a window is shown; a process started
+        just to run a command never arms them.
+        """
+        if self.reminders is not None:
+            return
+        with phase('reminders'):
+            from reminders import ReminderService
+            self.reminders = ReminderService(self, self.data_manager)
+        
+    def _setup_styles(self):
+        """Load the stylesheets the first time a window is needed.
+        
+        Not at startup: a service or a command-only invocation never shows one.
+        """
+        if self.accent is not None:
+            return
+        with phase('CSS'):
+            self._load_css()
+        # One accent stylesheet for the display, updated live from the portal
+        with phase('accent'):
+            from accent import AccentWatcher
+            self.accent = AccentWatcher(Gdk.Display.get_default())
+        
+    def do_shutdown(self):
+        if self.reminders:
+            self.reminders.stop()
+        if self.data_manager:
+            self.data_manager.flush()
+        Adw.Application.do_shutdown(self)
+        
     def _load_css(self):
-        """Load custom CSS styles."""
+        """Load custom CSS styles when running from an unbuilt source tree."""
+        if has_resource(RESOURCE_BASE_PATH + '/style.css'):
+            # Already loaded by Adw.Application from the resource bundle
+            return
+        
         css_provider = Gtk.CssProvider()
         
         # Try multiple paths for CSS file
@@ -75,8 +139,71 @@ class CandelaApp(Adw.Application):
     def do_activate(self):
         win = self.props.active_window
         if not win:
+            self._setup_styles()
+            # Imported here so invocations that only forward a command skip it
+            with phase('window import'):
+                from window import BirthdayWindow
             win = BirthdayWindow(application=self)
+        self._start_reminders()
         win.present()
+        
+    def do_command_line(self, command_line):
+        """Handle `candela [COMMAND ...]` from this or another process.
+        
+        A second `candela` invocation sends its arguments to the running
+        instance over D-Bus and exits, so commands apply to the events in
+        memory here and an open window updates through its change listener.
+        """
+        argv = command_line.get_arguments()[1:]
+        if not argv:
+            self.activate()
+            return 0
+        
+        from cli import build_parser, run
+        if self._command_parser is None:
+            self._command_parser = build_parser(app=True)
+        # Output goes back to the invoking terminal, not this process's
+        out, err = io.StringIO(), io.StringIO()
+        args = None
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                args = self._command_parser.parse_args(argv)
+                if args.command == 'show':
+                    status = 0
+                else:
+                    if getattr(args, 'output', None):
+                        args.output = os.path.join(command_line.get_cwd() or '', args.output)
+                    # Let a background load finish, so the command sees every event
+                    self.data_manager.wait_loaded()
+                    status = run(args, self.data_manager, out)
+        except SystemExit as e:
+            # From argparse, for --help and usage errors
+            status = e.code or 0
+        except OSError as e:
+            # Saving an added or deleted event failed; tell the caller
+            print(f"✗ {e}", file=err)
+            status = 1
+        
+        if args is not None and args.command == 'show':
+            self.activate()
+            if args.id is not None and not self.props.active_window.show_event(args.id):
+                print(f"✗ No event with id {args.id}", file=err)
+                status = 1
+        _print_to(command_line, out.getvalue())
+        _print_to(command_line, err.getvalue(), error=True)
+        return status
+
+
+def _print_to(command_line, text: str, error: bool = False):
+    """Print text on the terminal a command line came from."""
+    if not text:
+        return
+    method = getattr(command_line, 'printerr_literal' if error else 'print_literal', None)
+    if method is not None:
+        method(text)
+    else:
+        # GLib before 2.80 has no literal printing; fall back to our own output
+        (sys.stderr if error else sys.stdout).write(text)
 
 
 def main():
@@ -25,38 +25,79 @@ class PreferencesWindow(Adw.PreferencesWindow):
         super().__init__(**kwargs)
         
         self.data_manager = data_manager
-        self.settings = data_manager.load_settings()
+        # Shared with the main window, which applies theme and language changes
+        self.settings = data_manager.settings
         self.on_language_changed = on_language_changed
+        # (setter, key) of every translated text, re-set on language change
+        self._translated = []
+        # (combo row, option keys, its notify::selected handler)
+        self._translated_models = []
         
-        self.set_title(_('preferences_title'))
+        self._translate(self.set_title, 'preferences_title')
         self.set_default_size(450, 500)
         self.set_modal(True)
         
         self._setup_ui()
         
+        self.settings.connect('language', self._on_language_setting)
+        self.connect('close-request', self._on_close_request)
+        
+    def _on_close_request(self, window):
+        """Stop following the shared settings."""
+        self.settings.disconnect('language', self._on_language_setting)
+        return False
+        
+    def _on_language_setting(self, key, lang):
+        """Relabel this window and let the parent relabel its own."""
+        set_language(lang)
+        self._relabel()
+        if self.on_language_changed:
+            self.on_language_changed()
+        
+    def _translate(self, setter, key):
+        """Set a translated text and remember it for language changes."""
+        setter(_(key))
+        self._translated.append((setter, key))
+        
+    def _translate_model(self, row, keys, handler):
+        """Fill a combo row with translated options and connect its handler."""
+        row.set_model(Gtk.StringList.new([_(key) for key in keys]))
+        self._translated_models.append((row, keys, handler))
+        
+    def _relabel(self):
+        """Re-set every translated text in place after a language change."""
+        for setter, key in self._translated:
+            setter(_(key))
+        for row, keys, handler in self._translated_models:
+            selected = row.get_selected()
+            # Swapping the model resets the selection; don't treat that as a choice
+            row.handler_block_by_func(handler)
+            row.set_model(Gtk.StringList.new([_(key) for key in keys]))
+            row.set_selected(selected)
+            row.handler_unblock_by_func(handler)
+        
     def _setup_ui(self):
         """Set up the preferences UI."""
         # Appearance page
         appearance_page = Adw.PreferencesPage()
-        appearance_page.set_title(_('appearance'))
+        self._translate(appearance_page.set_title, 'appearance')
         appearance_page.set_icon_name("applications-graphics-symbolic")
         
         # Theme group
         theme_group = Adw.PreferencesGroup()
-        theme_group.set_title(_('theme'))
-        theme_group.set_description(_('theme_description'))
+        self._translate(theme_group.set_title, 'theme')
+        self._translate(theme_group.set_description, 'theme_description')
         
         # Theme combo row
         self.theme_row = Adw.ComboRow()
-        self.theme_row.set_title(_('color_scheme'))
-        self.theme_row.set_subtitle(_('color_scheme_subtitle'))
+        self._translate(self.theme_row.set_title, 'color_scheme')
+        self._translate(self.theme_row.set_subtitle, 'color_scheme_subtitle')
         
-        theme_model = Gtk.StringList.new([_('system'), _('light'), _('dark')])
-        self.theme_row.set_model(theme_model)
+        self._translate_model(self.theme_row, ('system', 'light', 'dark'), self._on_theme_changed)
         
         # Set current theme
         theme_map = {'system': 0, 'light': 1, 'dark': 2}
-        current_theme = self.settings.get('theme', 'system')
+        current_theme = self.settings['theme']
         self.theme_row.set_selected(theme_map.get(current_theme, 0))
         
         self.theme_row.connect('notify::selected', self._on_theme_changed)
@@ -66,20 +107,20 @@ class PreferencesWindow(Adw.PreferencesWindow):
         
         # Language group
         lang_group = Adw.PreferencesGroup()
-        lang_group.set_title(_('language'))
-        lang_group.set_description(_('language_description'))
+        self._translate(lang_group.set_title, 'language')
+        self._translate(lang_group.set_description, 'language_description')
         
         # Language combo row
         self.lang_row = Adw.ComboRow()
-        self.lang_row.set_title(_('language_selection'))
-        self.lang_row.set_subtitle(_('language_subtitle'))
+        self._translate(self.lang_row.set_title, 'language_selection')
+        self._translate(self.lang_row.set_subtitle, 'language_subtitle')
         
-        lang_model = Gtk.StringList.new([_('auto'), _('turkish'), _('english'), _('spanish')])
-        self.lang_row.set_model(lang_model)
+        self._translate_model(self.lang_row, ('auto', 'turkish', 'english', 'spanish'),
+                              self._on_language_changed)
         
         # Set current language
         lang_map = {'auto': 0, 'tr': 1, 'en': 2, 'es': 3}
-        current_lang = self.settings.get('language', 'auto')
+        current_lang = self.settings['language']
         self.lang_row.set_selected(lang_map.get(current_lang, 0))
         
         self.lang_row.connect('notify::selected', self._on_language_changed)
@@ -90,27 +131,27 @@ class PreferencesWindow(Adw.PreferencesWindow):
         
         # Notifications page
         notifications_page = Adw.PreferencesPage()
-        notifications_page.set_title(_('notifications'))
+        self._translate(notifications_page.set_title, 'notifications')
         notifications_page.set_icon_name("preferences-system-notifications-symbolic")
         
         # Notifications group
         notif_group = Adw.PreferencesGroup()
-        notif_group.set_title(_('notification_settings'))
-        notif_group.set_description(_('notification_description'))
+        self._translate(notif_group.set_title, 'notification_settings')
+        self._translate(notif_group.set_description, 'notification_description')
         
         # Enable notifications switch
         self.notif_switch = Adw.SwitchRow()
-        self.notif_switch.set_title(_('enable_notifications'))
-        self.notif_switch.set_subtitle(_('enable_notifications_subtitle'))
-        self.notif_switch.set_active(self.settings.get('notifications_enabled', True))
+        self._translate(self.notif_switch.set_title, 'enable_notifications')
+        self._translate(self.notif_switch.set_subtitle, 'enable_notifications_subtitle')
+        self.notif_switch.set_active(self.settings['notifications_enabled'])
         self.notif_switch.connect('notify::active', self._on_notification_toggle)
         notif_group.add(self.notif_switch)
         
         # Days before notification
         self.days_row = Adw.SpinRow.new_with_range(1, 30, 1)
-        self.days_row.set_title(_('reminder_days'))
-        self.days_row.set_subtitle(_('reminder_days_subtitle'))
-        self.days_row.set_value(self.settings.get('notification_days', 7))
+        self._translate(self.days_row.set_title, 'reminder_days')
+        self._translate(self.days_row.set_subtitle, 'reminder_days_subtitle')
+        self.days_row.set_value(self.settings['notification_days'])
         self.days_row.connect('notify::value', self._on_days_changed)
         notif_group.add(self.days_row)
         
@@ -119,30 +160,30 @@ class PreferencesWindow(Adw.PreferencesWindow):
         
         # About page
         about_page = Adw.PreferencesPage()
-        about_page.set_title(_('about'))
+        self._translate(about_page.set_title, 'about')
         about_page.set_icon_name("help-about-symbolic")
         
         # App info group
         info_group = Adw.PreferencesGroup()
-        info_group.set_title(_('app_info'))
+        self._translate(info_group.set_title, 'app_info')
         
         # Version row
         version_row = Adw.ActionRow()
-        version_row.set_title(_('version'))
+        self._translate(version_row.set_title, 'version')
         version_row.set_subtitle(BUILD_VERSION)
         version_row.add_prefix(Gtk.Image.new_from_icon_name("emblem-system-symbolic"))
         info_group.add(version_row)
         
         # Build date row
         build_row = Adw.ActionRow()
-        build_row.set_title(_('build_date'))
+        self._translate(build_row.set_title, 'build_date')
         build_row.set_subtitle(BUILD_DATE)
         build_row.add_prefix(Gtk.Image.new_from_icon_name("x-office-calendar-symbolic"))
         info_group.add(build_row)
         
         # Developer row
         dev_row = Adw.ActionRow()
-        dev_row.set_title(_('developer'))
+        self._translate(dev_row.set_title, 'developer')
         dev_row.set_subtitle("Reend")
         dev_row.add_prefix(Gtk.Image.new_from_icon_name("avatar-default-symbolic"))
         info_group.add(dev_row)
@@ -165,10 +206,10 @@ class PreferencesWindow(Adw.PreferencesWindow):
         
         # Credits group
         credits_group = Adw.PreferencesGroup()
-        credits_group.set_title(_('technologies'))
+        self._translate(credits_group.set_title, 'technologies')
         
         tech_row = Adw.ActionRow()
-        tech_row.set_title(_('built_with'))
+        self._translate(tech_row.set_title, 'built_with')
         tech_row.set_subtitle("Python • GTK4 • Libadwaita")
         tech_row.add_prefix(Gtk.Image.new_from_icon_name("applications-science-symbolic"))
         credits_group.add(tech_row)
@@ -182,17 +223,8 @@ class PreferencesWindow(Adw.PreferencesWindow):
         theme_map = {0: 'system', 1: 'light', 2: 'dark'}
         theme = theme_map.get(selected, 'system')
         
+        # Applied by the main window, which follows the setting
         self.settings['theme'] = theme
-        self.data_manager.save_settings(self.settings)
-        
-        # Apply theme
-        style_manager = Adw.StyleManager.get_default()
-        color_scheme_map = {
-            'system': Adw.ColorScheme.DEFAULT,
-            'light': Adw.ColorScheme.FORCE_LIGHT,
-            'dark': Adw.ColorScheme.FORCE_DARK
-        }
-        style_manager.set_color_scheme(color_scheme_map.get(theme, Adw.ColorScheme.DEFAULT))
         
     def _on_language_changed(self, row, _pspec):
         """Handle language change."""
@@ -200,28 +232,16 @@ class PreferencesWindow(Adw.PreferencesWindow):
         lang_map = {0: 'auto', 1: 'tr', 2: 'en', 3: 'es'}
         lang = lang_map.get(selected, 'auto')
         
+        # Relabeling happens in _on_language_setting
         self.settings['language'] = lang
-        self.data_manager.save_settings(self.settings)
-        
-        # Apply language
-        set_language(lang)
-        
-        # Notify parent to rebuild UI
-        if self.on_language_changed:
-            self.on_language_changed()
-        
-        # Close preferences and let user reopen to see changes
-        self.close()
         
     def _on_notification_toggle(self, switch, _pspec):
         """Handle notification toggle."""
         self.settings['notifications_enabled'] = switch.get_active()
-        self.data_manager.save_settings(self.settings)
         
     def _on_days_changed(self, row, _pspec):
         """Handle notification days change."""
         self.settings['notification_days'] = int(row.get_value())
-        self.data_manager.save_settings(self.settings)
     
     def _on_github_clicked(self, row):
         """Open GitHub profile in browser."""
@@ -0,0 +1,255 @@
+"""
+Reminders - Sends event notifications from a single timer.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from gi.repository import Gio, GLib
+
+from data_manager import DataManager
+from event_model import Event
+from ledger import NotificationLedger, ReminderKey
+from translations import _
+
+
+# Reminders for a day go out at this local time
+REMINDER_TIME = time(9, 0)
+
+# Settings that change which reminders are due
+SETTINGS_WATCHED = ('notifications_enabled', 'notification_days')
+
+NOTIFICATION_ICON = 'org.reend.candela'
+
+# Files in the data directory that hold events (events.db-wal for SQLite commits)
+EVENT_FILES = ('events.json', 'events.journal', 'events.db', 'events.db-wal')
+
+
+def _parse_created(event: Event) -> Optional[datetime]:
+    """When an event was added, if known."""
+    try:
+        return datetime.fromisoformat(event.created_at)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReminderService:
+    """Notifies about each event notification_days before it and on the day.
+
+    The next day with a reminder is looked up in the calendar index and a
+    single GLib timeout is armed for REMINDER_TIME on it, so the process
+    only wakes when a reminder is due. Event and settings changes, changes
+    to the data files from other processes, and resuming from suspend
+    (GLib timeouts run on the monotonic clock, which stops while asleep)
+    re-arm the timer.
+    
+    Sent reminders go in the ledger. Whenever the timer is re-armed, any
+    reminder already due for an occurrence still ahead but not in the
+    ledger is sent, which catches up on time spent offline or asleep.
+    """
+
+    def __init__(self, application: Gio.Application, data_manager: DataManager):
+        self.application = application
+        self.data_manager = data_manager
+        self.settings = data_manager.settings
+        self.ledger = NotificationLedger(data_manager.data_dir / 'reminders.ledger',
+                                         data_manager.writer)
+        # Local date and time the timer is armed for, if any
+        self.next_day: Optional[date] = None
+        self.next_fire: Optional[datetime] = None
+        self._source_id = 0
+        self._reschedule_source = 0
+        self._loaded_source = 0
+        # Set once the ledger is read; until then nothing is sent or armed
+        self._ready = False
+        self._stopped = False
+        self._login_proxy = None
+        # Store generation the timer was armed for
+        self._generation = None
+
+        data_manager.add_change_listener(self._on_events_changed)
+        for key in SETTINGS_WATCHED:
+            self.settings.connect(key, self._on_setting_changed)
+        # Other processes (e.g. the command line tool) write the same files
+        self._monitor = Gio.File.new_for_path(str(data_manager.data_dir)).monitor_directory(
+            Gio.FileMonitorFlags.NONE, None)
+        self._monitor.connect('changed', self._on_data_file_changed)
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SYSTEM,
+            Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES,
+            None,
+            'org.freedesktop.login1',
+            '/org/freedesktop/login1',
+            'org.freedesktop.login1.Manager',
+            None,
+            self._on_login_proxy_ready
+        )
+        # Read the events and the ledger off the main thread before the first lookup
+        data_manager.load_async(self._load)
+
+    def _load(self):
+        """Read the ledger on the writer thread, then schedule from the main loop."""
+        self.ledger.load(date.today())
+        self._loaded_source = GLib.idle_add(self._on_loaded)
+
+    def _on_loaded(self):
+        self._loaded_source = 0
+        # The load may finish after stop(), e.g. when shutdown flushes the writer
+        if not self._stopped:
+            self._ready = True
+            self.reschedule()
+        return GLib.SOURCE_REMOVE
+
+    def _on_login_proxy_ready(self, source, result):
+        try:
+            self._login_proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except GLib.Error as e:
+            print(f"✗ Suspend notifications unavailable: {e.message}")
+            return
+        self._login_proxy.connect('g-signal', self._on_login_signal)
+
+    def _on_login_signal(self, proxy, sender_name, signal_name, parameters):
+        if signal_name == 'PrepareForSleep' and not parameters.unpack()[0]:
+            # Just resumed; the armed timeout is late by however long we slept
+            self.queue_reschedule()
+
+    def _on_events_changed(self, change):
+        self.queue_reschedule()
+
+    def _on_setting_changed(self, key, value):
+        self.queue_reschedule()
+
+    def _on_data_file_changed(self, monitor, file, other_file, event_type):
+        """Re-arm when another process changed the events.
+
+        Our own writes (journal appends, snapshots, settings, the ledger)
+        are skipped: by file name, or because the store already has them
+        and its generation stays put.
+        """
+        if not self._ready or file.get_basename() not in EVENT_FILES:
+            return
+        if self.data_manager.refresh() != self._generation:
+            self.queue_reschedule()
+
+    def queue_reschedule(self):
+        """Re-arm from the main loop, once per burst of changes.
+        
+        Changes during the initial load are covered by the reschedule
+        that follows it.
+        """
+        if self._ready and not self._reschedule_source:
+            self._reschedule_source = GLib.idle_add(self._on_reschedule_idle)
+
+    def _on_reschedule_idle(self):
+        self._reschedule_source = 0
+        self.reschedule()
+        return GLib.SOURCE_REMOVE
+
+    def find_next_day(self, start: date) -> Optional[date]:
+        """The first day from start on with any reminder to send, or None."""
+        days_before = self.settings['notification_days']
+        best = None
+        for days_ahead, events in self.data_manager.walk_calendar(start):
+            if best is not None and days_ahead - days_before >= best:
+                # Later events can't have an earlier reminder
+                break
+            for candidate in (days_ahead - days_before, days_ahead):
+                if candidate >= 0 and (best is None or candidate < best):
+                    best = candidate
+        return None if best is None else start + timedelta(days=best)
+
+    def due_reminders(self, now: datetime) -> List[Tuple[Event, int, List[ReminderKey]]]:
+        """Reminders due by now that are not in the ledger yet.
+
+        Returns (event, days until it, keys to record) per event. Only
+        occurrences from today on count, and only reminders timed after the
+        event was created, so adding an event doesn't announce it late.
+        When several reminders for an occurrence are due, the latest one
+        is sent and all of them are recorded.
+        """
+        today = now.date()
+        days_before = self.settings['notification_days']
+        due = []
+        for days_until, events in self.data_manager.walk_calendar(today, days_before):
+            occurrence = today + timedelta(days=days_until)
+            for event in events:
+                created = _parse_created(event)
+                keys = []
+                for offset in sorted({0, days_before}):
+                    fire = datetime.combine(occurrence - timedelta(days=offset), REMINDER_TIME)
+                    if fire > now or (created and fire < created):
+                        continue
+                    keys.append((event.id, occurrence.year, offset))
+                if keys and keys[0] not in self.ledger:
+                    due.append((event, days_until, keys))
+        return due
+
+    def send_due(self, now: Optional[datetime] = None):
+        """Send every reminder that is due and not sent yet, and record them."""
+        now = now or datetime.now()
+        self.ledger.prune(now.date())
+        sent = []
+        for event, days_until, keys in self.due_reminders(now):
+            self._send(event, days_until, now.date())
+            occurrence = now.date() + timedelta(days=days_until)
+            sent.extend((key, occurrence) for key in keys)
+        self.ledger.record(sent)
+
+    def reschedule(self):
+        """Send anything due, then arm the timer for the next reminder.
+        
+        Does nothing before the ledger is loaded, which would resend
+        reminders already sent and race the load on the writer thread.
+        """
+        if not self._ready:
+            return
+        self._generation = self.data_manager.refresh()
+        if self._source_id:
+            GLib.source_remove(self._source_id)
+            self._source_id = 0
+        self.next_day = self.next_fire = None
+        if not self.settings['notifications_enabled']:
+            return
+        now = datetime.now()
+        self.send_due(now)
+        today = now.date()
+        start = today if now.time() < REMINDER_TIME else today + timedelta(days=1)
+        self.next_day = self.find_next_day(start)
+        if self.next_day is None:
+            return
+        self.next_fire = datetime.combine(self.next_day, REMINDER_TIME)
+        seconds = max(0, int((self.next_fire - datetime.now()).total_seconds()) + 1)
+        self._source_id = GLib.timeout_add_seconds(seconds, self._on_timeout)
+
+    def _on_timeout(self):
+        self._source_id = 0
+        # Sends what is due; if the clock was turned back, just re-arms
+        self.reschedule()
+        return GLib.SOURCE_REMOVE
+
+    def _send(self, event: Event, days_until: int, day: date):
+        """Show the notification for one reminder."""
+        if days_until == 0:
+            body = _('today')
+        elif days_until == 1:
+            body = _('tomorrow')
+        else:
+            body = _('days_left').format(days_until)
+        notification = Gio.Notification.new(event.name)
+        notification.set_body(body)
+        notification.set_icon(Gio.ThemedIcon.new(NOTIFICATION_ICON))
+        year = (day + timedelta(days=days_until)).year
+        self.application.send_notification(f'event-{event.id}-{year}-{days_until}', notification)
+
+    def stop(self):
+        """Disarm the timer and stop following changes."""
+        self._stopped = True
+        self._ready = False
+        for source_id in (self._source_id, self._reschedule_source, self._loaded_source):
+            if source_id:
+                GLib.source_remove(source_id)
+        self._source_id = self._reschedule_source = self._loaded_source = 0
+        self._monitor.cancel()
+        self.data_manager.remove_change_listener(self._on_events_changed)
+        for key in SETTINGS_WATCHED:
+            self.settings.disconnect(key, self._on_setting_changed)
@@ -0,0 +1,92 @@
+"""
+Resources - Compiled GResource bundle with a fallback to the source tree.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+import gi
+gi.require_version('Gdk', '4.0')
+gi.require_version('GdkPixbuf', '2.0')
+
+from gi.repository import Gdk, GdkPixbuf, Gio, GLib
+
+
+RESOURCE_BASE_PATH = '/org/reend/candela'
+RESOURCE_FILE = 'candela.gresource'
+LOGO_RESOURCE = RESOURCE_BASE_PATH + '/icons/candela-symbolic.png'
+
+_registered = False
+
+
+def register_resources() -> bool:
+    """Register candela.gresource, installed next to the Python modules.
+    
+    Returns False when running from an unbuilt source tree, where files are
+    read from disk instead.
+    """
+    global _registered
+    if _registered:
+        return True
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), RESOURCE_FILE)
+    try:
+        Gio.Resource.load(path)._register()
+    except GLib.Error:
+        return False
+    _registered = True
+    return True
+
+
+def has_resource(path: str) -> bool:
+    """Check whether a path exists in the registered resources."""
+    try:
+        Gio.resources_get_info(path, Gio.ResourceLookupFlags.NONE)
+        return True
+    except GLib.Error:
+        return False
+
+
+def get_icon_path():
+    """Find the application icon file path."""
+    # Try multiple paths for the icon
+    icon_paths = [
+        # Development path (running from source)
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'candela-symbolic.png'),
+        # Flatpak installed path
+        '/app/share/candela/candela-symbolic.png',
+        # System installed paths
+        '/usr/share/candela/candela-symbolic.png',
+        '/usr/local/share/candela/candela-symbolic.png',
+    ]
+    
+    for icon_path in icon_paths:
+        if os.path.exists(icon_path):
+            return icon_path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_logo_texture(size: int = 0) -> Optional[Gdk.Texture]:
+    """The app logo, decoded once and shared by every image showing it.
+    
+    With a size, the logo is pre-scaled to size x size pixels, so large
+    on-screen uses don't keep the full 512 px image around.
+    """
+    try:
+        if size:
+            if register_resources():
+                pixbuf = GdkPixbuf.Pixbuf.new_from_resource_at_scale(LOGO_RESOURCE, size, size, True)
+            else:
+                icon_path = get_icon_path()
+                if icon_path is None:
+                    return None
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(icon_path, size, size, True)
+            return Gdk.Texture.new_for_pixbuf(pixbuf)
+        if register_resources():
+            return Gdk.Texture.new_from_resource(LOGO_RESOURCE)
+        icon_path = get_icon_path()
+        return Gdk.Texture.new_from_filename(icon_path) if icon_path else None
+    except GLib.Error as e:
+        print(f"Error loading logo: {e.message}")
+        return None
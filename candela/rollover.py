@@ -0,0 +1,56 @@
+"""
+Rollover - Notices the local date changing while the app is open.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Callable
+
+from gi.repository import GLib
+
+
+class MidnightScheduler:
+    """Calls back once per local midnight with the number of days that passed.
+
+    Only one GLib timeout is armed at a time, for the next midnight.
+    GLib timeouts run on the monotonic clock, which stops during suspend, so
+    check() also compares the wall clock and should be called whenever the
+    app may have been asleep (e.g. when the window becomes active again).
+    """
+
+    def __init__(self, callback: Callable[[int], None]):
+        self._callback = callback
+        self._today = date.today()
+        self._source_id = 0
+        self._arm()
+
+    def _arm(self):
+        """Arm a single timeout for just after the next local midnight."""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        seconds = int((midnight - now).total_seconds()) + 1
+        self._source_id = GLib.timeout_add_seconds(seconds, self._on_timeout)
+
+    def _on_timeout(self):
+        self._source_id = 0
+        self.check()
+        if not self._source_id:
+            # Woke a little early; try again at midnight
+            self._arm()
+        return GLib.SOURCE_REMOVE
+
+    def check(self):
+        """Compare the wall clock with the last known date and fire if it changed."""
+        today = date.today()
+        if today == self._today:
+            return
+        days_passed = (today - self._today).days
+        self._today = today
+        self.stop()
+        self._arm()
+        self._callback(days_passed)
+
+    def stop(self):
+        """Disarm the pending timeout."""
+        if self._source_id:
+            GLib.source_remove(self._source_id)
+            self._source_id = 0
@@ -0,0 +1,115 @@
+"""
+Settings - Application settings loaded once, with change callbacks.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from write_behind import WriteBehind, atomic_write_json
+
+
+# Every known setting and its default; a default's type is the setting's type
+DEFAULTS = {
+    'theme': 'system',  # 'system', 'light', 'dark'
+    'language': 'auto',  # 'auto', 'tr', 'en', 'es'
+    'notifications_enabled': True,
+    'notification_days': 7,
+    'storage_backend': 'json',  # 'json', 'sqlite'
+}
+
+
+def _coerce(key: str, value):
+    """Convert a value to the type of the setting's default, if it has one."""
+    default = DEFAULTS.get(key)
+    if default is None or value is None or isinstance(value, type(default)):
+        return value
+    try:
+        if isinstance(default, bool):
+            if isinstance(value, str):
+                return value.lower() in ('1', 'true', 'yes', 'on')
+            return bool(value)
+        return type(default)(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class Settings:
+    """The application's settings, read from settings.json once.
+
+    Reads like a dict with the defaults filled in. Assigning a different
+    value calls the callbacks connected to that key with (key, value) and
+    schedules a coalesced write of settings.json on the writer thread, so
+    a burst of changes (e.g. a spin button being dragged) costs one write.
+    Keys not in DEFAULTS are kept and written back unchanged.
+    """
+
+    def __init__(self, path: Path, writer: WriteBehind):
+        self.path = path
+        self.writer = writer
+        self._values: Optional[Dict] = None
+        self._callbacks: Dict[str, List[Callable[[str, Any], None]]] = {}
+
+    def _load(self) -> Dict:
+        """Read settings.json the first time a setting is needed."""
+        if self._values is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                stored = {}
+            if not isinstance(stored, dict):
+                stored = {}
+            self._values = {**DEFAULTS, **{k: _coerce(k, v) for k, v in stored.items()}}
+        return self._values
+
+    def __getitem__(self, key: str):
+        return self._load()[key]
+
+    def __setitem__(self, key: str, value):
+        self.update({key: value})
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def get(self, key: str, default=None):
+        """Look up a setting, like dict.get."""
+        return self._load().get(key, default)
+
+    def as_dict(self) -> Dict:
+        """Return a copy of every setting."""
+        return dict(self._load())
+
+    def update(self, values: Dict):
+        """Change several settings, then notify and save once."""
+        current = self._load()
+        changed = []
+        for key, value in values.items():
+            value = _coerce(key, value)
+            if key not in current or current[key] != value:
+                current[key] = value
+                changed.append(key)
+        if not changed:
+            return
+        self._save()
+        for key in changed:
+            for callback in list(self._callbacks.get(key, ())):
+                callback(key, current[key])
+
+    def connect(self, key: str, callback: Callable[[str, Any], None]):
+        """Call callback(key, value) whenever the setting changes."""
+        self._callbacks.setdefault(key, []).append(callback)
+
+    def disconnect(self, key: str, callback: Callable[[str, Any], None]):
+        """Stop calling a callback connected with connect()."""
+        callbacks = self._callbacks.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _save(self):
+        """Schedule a write of the current settings."""
+        values = dict(self._values)
+        self.writer.schedule('settings', lambda: atomic_write_json(self.path, values))
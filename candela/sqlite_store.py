@@ -0,0 +1,169 @@
+"""
+SQLite Store - Optional indexed event storage in events.db.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from event_model import EVENT_FIELDS, Event
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    day INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    year INTEGER,
+    notes TEXT,
+    event_type TEXT,
+    anniversary_type TEXT,
+    created_at TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS events_month_day ON events (month, day);
+CREATE INDEX IF NOT EXISTS events_event_type ON events (event_type);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+_SELECT = f"SELECT {', '.join(EVENT_FIELDS)}, extra FROM events"
+
+
+class SqliteEventStore:
+    """Event store backed by an SQLite database.
+
+    Same interface as JsonEventStore. Month queries are answered by range
+    scans over the (month, day) index instead of walking every event; the
+    id primary key doubles as the id index.
+    """
+
+    def __init__(self, db_file: Path):
+        self.db_file = db_file
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        self.is_new = row is None
+        self.next_id = row[0] if row else 1
+        # Bumped whenever the database was replaced or changed by another connection
+        self.generation = 0
+        self._data_version = self._read_data_version()
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Serializes writes; hold it to read a consistent state from another thread."""
+        return self._lock
+
+    @staticmethod
+    def _to_event(row) -> Event:
+        """Build an event record from a result row."""
+        return Event(*row[:-1], extra=json.loads(row[-1]) if row[-1] else None)
+
+    @staticmethod
+    def _to_row(event: Dict) -> tuple:
+        """Split an event dict into column values plus JSON for unknown keys."""
+        extra = {k: v for k, v in event.items() if k not in EVENT_FIELDS and k != 'days_until'}
+        return tuple(event.get(k) for k in EVENT_FIELDS) + (
+            json.dumps(extra, ensure_ascii=False) if extra else None,)
+
+    def _store_next_id(self):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)",
+                           (self.next_id,))
+        self.is_new = False
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def refresh(self):
+        """Notice commits from other connections; queries always read the database."""
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            self._data_version = data_version
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+            if row:
+                self.next_id = max(self.next_id, row[0])
+            self.generation += 1
+
+    def allocate_id(self) -> int:
+        """Hand out the next id; ids are never reused after a delete."""
+        event_id = self.next_id
+        self.next_id += 1
+        self._store_next_id()
+        return event_id
+
+    def events(self) -> Iterable[Event]:
+        """Iterate over the stored events in id order."""
+        return [self._to_event(r) for r in self._conn.execute(_SELECT + ' ORDER BY id')]
+
+    def dates(self) -> Iterable[Tuple[int, int, int]]:
+        """Iterate over (id, month, day) of every event."""
+        return self._conn.execute('SELECT id, month, day FROM events').fetchall()
+
+    def get(self, event_id: int) -> Optional[Event]:
+        """Return the stored event with this id, or None."""
+        row = self._conn.execute(_SELECT + ' WHERE id = ?', (event_id,)).fetchone()
+        return self._to_event(row) if row else None
+
+    def add(self, event: Dict) -> Event:
+        """Store a new event, assigning its id."""
+        with self._lock, self._conn:
+            event = {'id': self.allocate_id(), **event}
+            self._conn.execute('INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                               self._to_row(event))
+        return Event.from_dict(event)
+
+    def update(self, event_id: int, fields: Dict) -> bool:
+        """Update fields of an event; returns False if it doesn't exist."""
+        with self._lock, self._conn:
+            event = self.get(event_id)
+            if event is None:
+                return False
+            event.update(fields)
+            row = self._to_row(event.to_dict())
+            self._conn.execute(
+                f"UPDATE events SET {', '.join(c + ' = ?' for c in EVENT_FIELDS[1:])}, extra = ? "
+                "WHERE id = ?", row[1:] + (event_id,))
+        return True
+
+    def delete(self, event_id: int) -> bool:
+        """Delete an event; returns False if it doesn't exist."""
+        with self._lock, self._conn:
+            return self._conn.execute('DELETE FROM events WHERE id = ?',
+                                      (event_id,)).rowcount > 0
+
+    def replace(self, events: List[Dict]):
+        """Replace every event in a single transaction.
+
+        Also used as the one-shot importer from events.json/birthdays.json.
+        """
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM events')
+            for event in events:
+                if event.get('id') is None:
+                    event['id'] = self.next_id
+                self.next_id = max(self.next_id, event['id'] + 1)
+            self._conn.executemany('INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                   (self._to_row(e) for e in events))
+            self._store_next_id()
+        self.generation += 1
+
+    def in_month(self, month: int) -> List[Event]:
+        """Events in the given month, ordered by day."""
+        rows = self._conn.execute(_SELECT + ' WHERE month = ? ORDER BY month, day', (month,))
+        return [self._to_event(r) for r in rows]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
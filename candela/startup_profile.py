@@ -0,0 +1,51 @@
+"""
+Startup Profile - Per-phase startup timings, printed with CANDELA_PROFILE_STARTUP=1.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+ENABLED = os.environ.get('CANDELA_PROFILE_STARTUP') == '1'
+
+# Counted from the first import of this module, which main.py does first
+_start = time.perf_counter()
+_open: Dict[str, float] = {}
+_phases: List[Tuple[str, float]] = []
+_reported = False
+
+
+def begin(name: str):
+    """Start timing a phase that ends in another callback."""
+    if ENABLED:
+        _open[name] = time.perf_counter()
+
+
+def end(name: str):
+    """Finish a phase started with begin()."""
+    if ENABLED and name in _open:
+        _phases.append((name, time.perf_counter() - _open.pop(name)))
+
+
+@contextmanager
+def phase(name: str):
+    """Time the enclosed block as one startup phase."""
+    begin(name)
+    try:
+        yield
+    finally:
+        end(name)
+
+
+def report():
+    """Print the breakdown once, when the first events are on screen."""
+    global _reported
+    if not ENABLED or _reported:
+        return
+    _reported = True
+    print("Startup profile:")
+    for name, seconds in _phases:
+        print(f"  {name:<24} {seconds * 1000:8.1f} ms")
+    print(f"  {'total':<24} {(time.perf_counter() - _start) * 1000:8.1f} ms")
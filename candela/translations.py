@@ -3,6 +3,8 @@ Translations - Internationalization support for Candela.
 """
 
 import locale
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 
 # Translation dictionaries
 TRANSLATIONS = {
@@ -91,6 +93,7 @@ TRANSLATIONS = {
         'deleted_toast': "'{name}' silindi",
         'deleted_memorial_toast': '...',
         'deleted_love_toast': 'Her şey gönlünce olsun.',
+        'save_error': 'Değişiklikler kaydedilemedi: {error}',
         
         # Preferences
         'preferences_title': 'Ayarlar',
@@ -223,6 +226,7 @@ TRANSLATIONS = {
         'deleted_toast': "'{name}' deleted",
         'deleted_memorial_toast': '...',
         'deleted_love_toast': 'May everything go as you wish.',
+        'save_error': "Couldn't save changes: {error}",
         
         # Preferences
         'preferences_title': 'Settings',
@@ -355,6 +359,7 @@ TRANSLATIONS = {
         'deleted_toast': "'{name}' eliminado",
         'deleted_memorial_toast': '...',
         'deleted_love_toast': 'Que todo salga como deseas.',
+        'save_error': 'No se pudieron guardar los cambios: {error}',
         
         # Preferences
         'preferences_title': 'Configuración',
@@ -404,10 +409,28 @@ TRANSLATIONS = {
     }
 }
 
+# Month name keys, January first
+MONTH_KEYS = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+              'august', 'september', 'october', 'november', 'december')
+
 # Current language
 _current_language = 'tr'
 
 
+@lru_cache(maxsize=None)
+def _resolve(lang_code) -> Tuple[Dict[str, str], Tuple[str, ...], Dict[str, Callable[..., str]]]:
+    """Resolve a language once: a flat table with English fallbacks merged in,
+    month names indexed by month number, and bound format methods."""
+    table = {**TRANSLATIONS['en'], **TRANSLATIONS.get(lang_code, {})}
+    months = ('',) + tuple(table.get(key, key) for key in MONTH_KEYS)
+    formatters = {key: text.format for key, text in table.items() if '{' in text}
+    return table, months, formatters
+
+
+# The active language's tables; switching language swaps these
+_table, _months, _formatters = _resolve(_current_language)
+
+
 def get_system_language():
     """Get the system language code."""
     try:
@@ -423,13 +446,14 @@ def get_system_language():
 
 def set_language(lang_code):
     """Set the current language."""
-    global _current_language
+    global _current_language, _table, _months, _formatters
     if lang_code == 'auto':
         _current_language = get_system_language()
     elif lang_code in TRANSLATIONS:
         _current_language = lang_code
     else:
         _current_language = 'en'
+    _table, _months, _formatters = _resolve(_current_language)
 
 
 def get_language():
@@ -439,16 +463,25 @@ def get_language():
 
 def _(key, **kwargs):
     """Get translated string for the given key."""
-    text = TRANSLATIONS.get(_current_language, TRANSLATIONS['en']).get(key, key)
+    text = _table.get(key, key)
     if kwargs:
         text = text.format(**kwargs)
     return text
 
 
+def get_formatter(key) -> Callable[..., str]:
+    """Get the bound format method of a translated string, e.g. get_formatter('days_left')(3)."""
+    formatter = _formatters.get(key)
+    return formatter if formatter is not None else _table.get(key, key).format
+
+
+def format_event_date(event) -> str:
+    """Format an event's date using translated month names."""
+    if event.year:
+        return f"{event.day} {_months[event.month]} {event.year}"
+    return f"{event.day} {_months[event.month]}"
+
+
 def get_month_names():
     """Get list of translated month names."""
-    return [
-        _('january'), _('february'), _('march'), _('april'),
-        _('may'), _('june'), _('july'), _('august'),
-        _('september'), _('october'), _('november'), _('december')
-    ]
+    return list(_months[1:])
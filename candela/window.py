@@ -2,37 +2,39 @@
 Main Window - The primary application window.
 """
 
-import os
+import time
+from bisect import bisect
+from heapq import merge
+from itertools import islice
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gio, GdkPixbuf
+from gi.repository import Gtk, Adw, Gio, GLib
 
-from data_manager import DataManager
-from birthday_row import EventRow, BirthdayRow
-from birthday_dialog import EventDialog, BirthdayDialog
-from preferences import PreferencesWindow
-from translations import _, set_language
+from data_manager import CHANGE_RESET, DataManager, EventChange
+from event_model import Event
+from listing import apply_change
+from birthday_row import EventObject, EventRow
+from resources import get_logo_texture
+from resources import get_icon_path  # Legacy support, used to live here
+from rollover import MidnightScheduler
+import startup_profile
+from startup_profile import phase
+from translations import _, format_event_date, set_language
 
 
-def get_icon_path():
-    """Find the application icon file path."""
-    # Try multiple paths for the icon
-    icon_paths = [
-        # Development path (running from source)
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'candela-symbolic.png'),
-        # Flatpak installed path
-        '/app/share/candela/candela-symbolic.png',
-        # System installed paths
-        '/usr/share/candela/candela-symbolic.png',
-        '/usr/local/share/candela/candela-symbolic.png',
-    ]
-    
-    for icon_path in icon_paths:
-        if os.path.exists(icon_path):
-            return icon_path
-    return None
+# Rows filled in before the window is first shown (about a screenful)
+INITIAL_ROWS = 40
+
+# Seconds of work per idle batch while filling in the remaining rows
+POPULATE_BUDGET = 0.008
+
+# Settings the open window reacts to
+SETTINGS_WATCHED = ('theme', 'language', 'notification_days')
+
+# The logo is shown at up to 160 px; decode it once at twice that for HiDPI
+LOGO_TEXTURE_SIZE = 320
 
 
 class CandelaWindow(Adw.ApplicationWindow):
@@ -43,7 +45,10 @@ class CandelaWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
-        self.data_manager = DataManager()
+        self.data_manager = getattr(self.get_application(), 'data_manager', None) or DataManager()
+        self.settings = self.data_manager.settings
+        # Idle source filling in the list after the first screenful, if any
+        self._populate_source = 0
         
         # Apply saved language first
         self._apply_saved_language()
@@ -53,193 +58,74 @@ class CandelaWindow(Adw.ApplicationWindow):
         
         self._apply_saved_theme()
         self._setup_accent_color()
-        self._setup_ui()
+        with phase('UI build'):
+            self._setup_ui()
+        
+        # Disk I/O happens on the data manager's writer thread; results and
+        # failures come back to the main loop through idle callbacks
+        self.data_manager.set_error_handler(lambda error: GLib.idle_add(self._on_io_error, error))
+        startup_profile.begin('first load')
+        self.data_manager.load_async(lambda: GLib.idle_add(self._on_events_loaded))
+        
+        # Keep days-until badges right when the app stays open past midnight
+        self._rollover = MidnightScheduler(self._on_day_changed)
+        self.connect('notify::is-active', lambda *args: self._rollover.check())
+        self.connect('close-request', self._on_close_request)
+        
+        # Follow changes made in preferences (or anywhere else) as they happen
+        for key in SETTINGS_WATCHED:
+            self.settings.connect(key, self._on_setting_changed)
+        
+    def _on_close_request(self, window):
+        """Detach from the app-owned data manager and timers."""
+        self._rollover.stop()
+        self._cancel_populate()
+        self.data_manager.remove_change_listener(self._on_events_changed)
+        self.data_manager.set_error_handler(None)
+        for key in SETTINGS_WATCHED:
+            self.settings.disconnect(key, self._on_setting_changed)
+        return False
+        
+    def _on_events_loaded(self):
+        """Show the events once the data manager has read them."""
         self._load_events()
+        startup_profile.end('first load')
+        startup_profile.report()
+        # Apply adds, updates and deletes to the list models one event at a time
+        self.data_manager.add_change_listener(self._on_events_changed)
+        return GLib.SOURCE_REMOVE
+        
+    def _on_io_error(self, error):
+        """Report a failed write in a toast."""
+        toast = Adw.Toast.new(_('save_error').format(error=getattr(error, 'strerror', None) or error))
+        toast.set_timeout(5)
+        self.toast_overlay.add_toast(toast)
+        return GLib.SOURCE_REMOVE
         
     def _setup_accent_color(self):
-        """Setup and apply system accent color dynamically."""
-        try:
-            from gi.repository import Gio, Gdk, GLib
-            
-            accent_rgba = None
-            
-            # Method 1: Try to get accent color from portal settings (works in Flatpak)
-            try:
-                portal = Gio.DBusProxy.new_for_bus_sync(
-                    Gio.BusType.SESSION,
-                    Gio.DBusProxyFlags.NONE,
-                    None,
-                    'org.freedesktop.portal.Desktop',
-                    '/org/freedesktop/portal/desktop',
-                    'org.freedesktop.portal.Settings',
-                    None
-                )
-                
-                # Read all settings from org.gnome.desktop.interface namespace
-                result = portal.call_sync(
-                    'ReadAll',
-                    GLib.Variant('(as)', (['org.gnome.desktop.interface'],)),
-                    Gio.DBusCallFlags.NONE,
-                    -1,
-                    None
-                )
-                
-                if result:
-                    # Parse the result to find accent-color
-                    settings_dict = result.unpack()[0]
-                    accent_color_name = None
-                    
-                    for namespace, values in settings_dict.items():
-                        if namespace == 'org.gnome.desktop.interface':
-                            if 'accent-color' in values:
-                                # The value is already a variant containing the string
-                                accent_variant = values['accent-color']
-                                # Check if it's a variant or already unpacked
-                                if hasattr(accent_variant, 'unpack'):
-                                    accent_color_name = accent_variant.unpack()
-                                else:
-                                    accent_color_name = accent_variant
-                                print(f"→ Found accent-color setting: '{accent_color_name}' (type: {type(accent_color_name).__name__})")
-                                break
-                    
-                    if accent_color_name:
-                        # GNOME accent colors mapping
-                        accent_colors = {
-                            'blue': (0.22, 0.55, 0.92),
-                            'teal': (0.13, 0.74, 0.61),
-                            'green': (0.30, 0.69, 0.29),
-                            'yellow': (0.96, 0.75, 0.14),
-                            'orange': (0.90, 0.49, 0.13),
-                            'red': (0.88, 0.26, 0.21),
-                            'pink': (0.91, 0.33, 0.64),
-                            'purple': (0.61, 0.35, 0.71),
-                            'slate': (0.45, 0.52, 0.59),
-                        }
-                        
-                        if accent_color_name in accent_colors:
-                            rgb = accent_colors[accent_color_name]
-                            accent_rgba = Gdk.RGBA()
-                            accent_rgba.red = rgb[0]
-                            accent_rgba.green = rgb[1]
-                            accent_rgba.blue = rgb[2]
-                            accent_rgba.alpha = 1.0
-                            print(f"✓ Portal accent color: {accent_color_name} -> RGB({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)})")
-            except Exception as e:
-                print(f"✗ Portal accent color read failed: {e}")
-            
-            # Method 2: Fallback to StyleContext lookup
-            if accent_rgba is None:
-                print("→ Trying fallback StyleContext method...")
-                display = self.get_display()
-                if display:
-                    temp_widget = Gtk.Label()
-                    temp_context = temp_widget.get_style_context()
-                    accent_color = temp_context.lookup_color('accent_bg_color')
-                    
-                    if accent_color[0]:
-                        accent_rgba = accent_color[1]
-                        print(f"✓ Using fallback accent color from StyleContext: RGB({int(accent_rgba.red*255)}, {int(accent_rgba.green*255)}, {int(accent_rgba.blue*255)})")
-            
-            # Apply the color if we got it
-            if accent_rgba:
-                display = self.get_display()
-                if display:
-                    # Calculate a slightly darker version for text/borders
-                    darker_r = max(0, accent_rgba.red - 0.1)
-                    darker_g = max(0, accent_rgba.green - 0.1)
-                    darker_b = max(0, accent_rgba.blue - 0.1)
-                    
-                    css_data = f"""
-                    /* Upcoming events background */
-                    .upcoming-list-bg {{
-                        background-color: rgba({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)}, 0.12);
-                    }}
-                    
-                    /* Suggested action buttons (Add, Save, etc.) */
-                    .suggested-action {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        color: white;
-                    }}
-                    
-                    .suggested-action:hover {{
-                        background-color: rgb({int(darker_r * 255)}, {int(darker_g * 255)}, {int(darker_b * 255)});
-                    }}
-                    
-                    /* Event type buttons when checked */
-                    .event-type-btn:checked {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        color: white;
-                    }}
-                    
-                    .event-type-btn:checked:hover {{
-                        background-color: rgb({int(darker_r * 255)}, {int(darker_g * 255)}, {int(darker_b * 255)});
-                    }}
-                    
-                    /* Switch (Enable Notifications toggle) */
-                    switch:checked {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                    }}
-                    
-                    switch:checked:hover {{
-                        background-color: rgb({int(darker_r * 255)}, {int(darker_g * 255)}, {int(darker_b * 255)});
-                    }}
-                    
-                    /* Calendar selected date */
-                    calendar:selected {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        color: white;
-                    }}
-                    
-                    calendar:selected:hover {{
-                        background-color: rgb({int(darker_r * 255)}, {int(darker_g * 255)}, {int(darker_b * 255)});
-                    }}
-                    
-                    /* Alternative calendar selectors for GTK4 */
-                    .calendar .day:selected {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        color: white;
-                    }}
-                    
-                    .calendar .day.today {{
-                        color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        font-weight: bold;
-                    }}
-                    
-                    /* Calendar header and navigation */
-                    .calendar button.day:checked {{
-                        background-color: rgb({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)});
-                        color: white;
-                    }}
-                    """
-                    
-                    css_provider = Gtk.CssProvider()
-                    css_provider.load_from_data(css_data.encode())
-                    Gtk.StyleContext.add_provider_for_display(
-                        display,
-                        css_provider,
-                        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
-                    )
-                    print(f"✓ Applied accent color to upcoming events: RGB({int(accent_rgba.red * 255)}, {int(accent_rgba.green * 255)}, {int(accent_rgba.blue * 255)})")
-
-            else:
-                print("✗ No accent color could be determined")
-        except Exception as e:
-            print(f"✗ Could not apply accent color: {e}")
-
-
-
-
+        """Follow the system accent color, unless the application already does."""
+        if getattr(self.get_application(), 'accent', None) is None:
+            from accent import AccentWatcher
+            self._accent = AccentWatcher(self.get_display())
+        
+    def _on_setting_changed(self, key, value):
+        """Apply a changed setting to the open window."""
+        if key == 'theme':
+            self._apply_saved_theme()
+        elif key == 'language':
+            self._apply_saved_language()
+            self._on_language_changed()
+        elif key == 'notification_days' and self.content_stack.get_visible_child_name() != "loading":
+            # The upcoming section is cut at this many days; before the first load it is read there
+            self._load_events()
         
     def _apply_saved_language(self):
         """Apply the saved language setting."""
-        settings = self.data_manager.load_settings()
-        lang = settings.get('language', 'auto')
-        set_language(lang)
+        set_language(self.settings['language'])
         
     def _apply_saved_theme(self):
         """Apply the saved theme setting."""
-        settings = self.data_manager.load_settings()
-        theme = settings.get('theme', 'system')
+        theme = self.settings['theme']
         
         style_manager = Adw.StyleManager.get_default()
         color_scheme_map = {
@@ -259,20 +145,20 @@ class CandelaWindow(Adw.ApplicationWindow):
         header = Adw.HeaderBar()
         
         # Add button (left)
-        add_btn = Gtk.Button()
-        add_btn.set_icon_name("list-add-symbolic")
-        add_btn.set_tooltip_text(_('add_event'))
-        add_btn.add_css_class("flat")
-        add_btn.connect('clicked', self._on_add_clicked)
-        header.pack_start(add_btn)
+        self.add_btn = Gtk.Button()
+        self.add_btn.set_icon_name("list-add-symbolic")
+        self.add_btn.set_tooltip_text(_('add_event'))
+        self.add_btn.add_css_class("flat")
+        self.add_btn.connect('clicked', self._on_add_clicked)
+        header.pack_start(self.add_btn)
         
         # Settings button (right)
-        settings_btn = Gtk.Button()
-        settings_btn.set_icon_name("emblem-system-symbolic")
-        settings_btn.set_tooltip_text(_('settings'))
-        settings_btn.add_css_class("flat")
-        settings_btn.connect('clicked', self._on_settings_clicked)
-        header.pack_end(settings_btn)
+        self.settings_btn = Gtk.Button()
+        self.settings_btn.set_icon_name("emblem-system-symbolic")
+        self.settings_btn.set_tooltip_text(_('settings'))
+        self.settings_btn.add_css_class("flat")
+        self.settings_btn.connect('clicked', self._on_settings_clicked)
+        header.pack_end(self.settings_btn)
         
         self.main_box.append(header)
         
@@ -286,17 +172,43 @@ class CandelaWindow(Adw.ApplicationWindow):
         self.content_stack.set_vexpand(True)
         self.toast_overlay.set_child(self.content_stack)
         
-        # Empty state
+        # Blank until the events have been read
+        self.content_stack.add_named(Gtk.Box(), "loading")
+        
+        # Upcoming events (within notification_days) and all other events,
+        # shown as two sections of one list view
+        self.upcoming_store = Gio.ListStore(item_type=EventObject)
+        self.events_store = Gio.ListStore(item_type=EventObject)
+        sections = Gio.ListStore(item_type=Gio.ListModel)
+        sections.append(self.upcoming_store)
+        sections.append(self.events_store)
+        self.event_model = Gtk.FlattenListModel(model=sections)
+        
+        # The empty state and list pages are built the first time they are shown
+        self.empty_title = None
+        self.empty_subtitle = None
+        self.event_list = None
+        # Rows and section headers currently on screen, relabeled on language change
+        self._bound_rows = set()
+        self._headers = set()
+        
+    def _show_page(self, name: str):
+        """Switch the content stack to a page, building it on first use."""
+        if self.content_stack.get_child_by_name(name) is None:
+            if name == "empty":
+                self._build_empty_page()
+            else:
+                self._build_list_page()
+        self.content_stack.set_visible_child_name(name)
+        
+    def _build_empty_page(self):
+        """Build the empty state page."""
         empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         empty_box.set_valign(Gtk.Align.CENTER)
         empty_box.set_halign(Gtk.Align.CENTER)
         
         # App logo icon
-        icon_path = get_icon_path()
-        if icon_path:
-            logo_icon = Gtk.Image.new_from_file(icon_path)
-        else:
-            logo_icon = Gtk.Image.new_from_icon_name("emblem-favorite-symbolic")
+        logo_icon = self._new_logo_image()
         logo_icon.set_pixel_size(128)
         logo_icon.add_css_class("app-icon")
         empty_box.append(logo_icon)
@@ -315,7 +227,8 @@ class CandelaWindow(Adw.ApplicationWindow):
         
         self.content_stack.add_named(empty_box, "empty")
         
-        # Event list view
+    def _build_list_page(self):
+        """Build the event list page."""
         list_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         
         # Scrolled window for the list
@@ -323,119 +236,180 @@ class CandelaWindow(Adw.ApplicationWindow):
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_vexpand(True)
         
-        # Main content box inside scrolled
-        list_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        list_content.set_margin_top(12)
-        list_content.set_margin_bottom(12)
-        list_content.set_margin_start(12)
-        list_content.set_margin_end(12)
+        # Rows are only built for the visible items and rebound on scroll
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_row_setup)
+        factory.connect('bind', self._on_row_bind)
+        factory.connect('unbind', self._on_row_unbind)
         
-        # Top banner with logo icon
-        banner_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        banner_box.set_halign(Gtk.Align.CENTER)
-        banner_box.set_margin_bottom(12)
-        
-        icon_path = get_icon_path()
-        if icon_path:
-            banner_icon = Gtk.Image.new_from_file(icon_path)
-        else:
-            banner_icon = Gtk.Image.new_from_icon_name("emblem-favorite-symbolic")
-        banner_icon.set_pixel_size(160)
-        banner_icon.add_css_class("app-icon")
-        banner_box.append(banner_icon)
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect('setup', self._on_header_setup)
+        header_factory.connect('bind', self._on_header_bind)
+        header_factory.connect('unbind', lambda factory, list_header: self._headers.discard(list_header))
         
-        list_content.append(banner_box)
+        self.event_list = Gtk.ListView(model=Gtk.NoSelection(model=self.event_model),
+                                       factory=factory, header_factory=header_factory)
+        self.event_list.set_single_click_activate(True)
+        self.event_list.add_css_class("event-list")
+        self.event_list.connect('activate', self._on_item_activated)
         
-        # Upcoming events list group (within 7 days)
-        self.upcoming_group = Adw.PreferencesGroup()
-        self.upcoming_group.set_title(_('upcoming_events'))
-        self.upcoming_group.add_css_class("upcoming-group")
+        scrolled.set_child(self.event_list)
+        list_container.append(scrolled)
         
-        self.upcoming_listbox = Gtk.ListBox()
-        self.upcoming_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.upcoming_listbox.add_css_class("boxed-list")
-        self.upcoming_listbox.add_css_class("upcoming-list-bg")
-        self.upcoming_listbox.connect('row-activated', self._on_row_activated)
+        self.content_stack.add_named(list_container, "list")
         
-        self.upcoming_group.add(self.upcoming_listbox)
-        list_content.append(self.upcoming_group)
+    def _new_logo_image(self):
+        """An image of the app logo, sharing one decoded texture."""
+        texture = get_logo_texture(LOGO_TEXTURE_SIZE)
+        if texture is not None:
+            return Gtk.Image.new_from_paintable(texture)
+        return Gtk.Image.new_from_icon_name("emblem-favorite-symbolic")
         
-        # All events list group
-        self.events_group = Adw.PreferencesGroup()
-        self.events_group.set_title(_('all_events'))
-        self.events_group.add_css_class("events-group")
+    def _on_row_setup(self, factory, list_item):
+        """Create a row widget for the list view to recycle."""
+        list_item.set_child(EventRow())
         
-        self.events_listbox = Gtk.ListBox()
-        self.events_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.events_listbox.add_css_class("boxed-list")
-        self.events_listbox.connect('row-activated', self._on_row_activated)
+    def _on_row_bind(self, factory, list_item):
+        """Show the item's event in a recycled row."""
+        row = list_item.get_child()
+        row.bind(list_item.get_item().event, self._upcoming_days)
+        self._bound_rows.add(row)
         
-        self.events_group.add(self.events_listbox)
-        list_content.append(self.events_group)
+    def _on_row_unbind(self, factory, list_item):
+        """Forget a row that scrolled out of view."""
+        self._bound_rows.discard(list_item.get_child())
         
-        scrolled.set_child(list_content)
-        list_container.append(scrolled)
+    def _on_header_setup(self, factory, list_header):
+        """Create a section header; the first one also carries the logo banner."""
+        header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        header_box.add_css_class("event-list-header")
         
-        self.content_stack.add_named(list_container, "list")
+        # Top banner with logo icon
+        banner_icon = self._new_logo_image()
+        banner_icon.set_pixel_size(160)
+        banner_icon.set_halign(Gtk.Align.CENTER)
+        banner_icon.add_css_class("app-icon")
+        header_box.append(banner_icon)
+        
+        title = Gtk.Label()
+        title.set_halign(Gtk.Align.START)
+        title.add_css_class("heading")
+        header_box.append(title)
+        
+        list_header.set_child(header_box)
+        # Sections grow and shrink without the header being rebound
+        list_header.connect('notify::start', self._update_header)
+        list_header.connect('notify::n-items', self._update_header)
+        
+    def _on_header_bind(self, factory, list_header):
+        """Title a section header with its group name and item count."""
+        self._headers.add(list_header)
+        self._update_header(list_header)
+        
+    def _update_header(self, list_header, *args):
+        """Refresh a section header's banner visibility and title."""
+        header_box = list_header.get_child()
+        banner_icon = header_box.get_first_child()
+        title = banner_icon.get_next_sibling()
+        start = list_header.get_start()
+        banner_icon.set_visible(start == 0)
+        if start < self.upcoming_store.get_n_items():
+            title.set_label(f"{_('upcoming_events')} ({list_header.get_n_items()})")
+        else:
+            title.set_label(f"{_('all_events')} ({list_header.get_n_items()})")
         
     def _load_events(self):
-        """Load and display events."""
-        # Clear existing rows from both listboxes
-        while True:
-            row = self.upcoming_listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.upcoming_listbox.remove(row)
+        """Load and display events.
+        
+        Only the first screenful is filled in right away, straight from the
+        calendar walk; the rest follows in idle batches so the window can
+        draw first.
+        """
+        self._cancel_populate()
+        events = self.data_manager.iter_sorted_events()
+        
+        self._show_items([EventObject(event) for event in islice(events, INITIAL_ROWS)])
+        self._update_empty_state()
+        if self.event_model.get_n_items() == INITIAL_ROWS:
+            self._populate_source = GLib.idle_add(self._populate_batch, events)
             
-        while True:
-            row = self.events_listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.events_listbox.remove(row)
-        
-        # Get sorted events
-        events = self.data_manager.get_sorted_events()
-        
-        if not events:
-            self.content_stack.set_visible_child_name("empty")
+    def _populate_batch(self, events):
+        """Append rows for POPULATE_BUDGET seconds, then yield to the main loop."""
+        deadline = time.monotonic() + POPULATE_BUDGET
+        items = []
+        for event in events:
+            items.append(EventObject(event))
+            if time.monotonic() > deadline:
+                self._append_items(items)
+                return GLib.SOURCE_CONTINUE
+        self._append_items(items)
+        self._populate_source = 0
+        return GLib.SOURCE_REMOVE
+        
+    def _cancel_populate(self):
+        """Stop filling in a listing that is being replaced."""
+        if self._populate_source:
+            GLib.source_remove(self._populate_source)
+            self._populate_source = 0
+            
+    def _append_items(self, items):
+        """Add sorted items after everything shown so far."""
+        # Upcoming items sort first, so each batch splits at one point
+        split = bisect([item.event.days_until for item in items], self._upcoming_days)
+        if split:
+            self.upcoming_store.splice(self.upcoming_store.get_n_items(), 0, items[:split])
+        if split < len(items):
+            self.events_store.splice(self.events_store.get_n_items(), 0, items[split:])
+        
+    def _update_empty_state(self):
+        """Show the empty state when there are no events."""
+        if self.event_model.get_n_items():
+            self._show_page("list")
+        else:
+            self._show_page("empty")
+            
+    def _on_events_changed(self, change: EventChange):
+        """Apply one data manager change with the minimal list model splice.
+        
+        Positions index the sorted listing, which the two stores split at
+        the upcoming threshold, so each change touches a single item.
+        """
+        if change.kind == CHANGE_RESET or self._populate_source:
+            # Positions refer to the full listing; start over if it isn't all shown
+            self._load_events()
             return
         
-        self.content_stack.set_visible_child_name("list")
-        
-        # Separate upcoming events (within 7 days) from others
-        upcoming_events = []
-        other_events = []
+        apply_change(self.upcoming_store, self.events_store, change,
+                     self._upcoming_days, EventObject)
+        self._update_empty_state()
+        
+    def _show_items(self, items):
+        """Split sorted items into the upcoming and all-events sections."""
+        # Separate upcoming events (within notification_days) from others
+        self._upcoming_days = self.data_manager.get_upcoming_days()
+        split = bisect([item.event.days_until for item in items], self._upcoming_days)
+        self.upcoming_store.splice(0, self.upcoming_store.get_n_items(), items[:split])
+        self.events_store.splice(0, self.events_store.get_n_items(), items[split:])
+        
+    def _on_day_changed(self, days_passed: int):
+        """Shift the listed events to a new date without reloading them.
+        
+        Every count drops by the same amount, so only events whose date has
+        passed (now a year away) move; only those are sorted and merged back.
+        """
+        items = list(self.upcoming_store) + list(self.events_store)
+        if days_passed < 0 or not items or self._populate_source:
+            # Clock went backwards, or still filling in; recompute everything
+            self._load_events()
+            return
         
-        for event in events:
-            days_until = event.get('days_until', 999)
-            if days_until <= 7:
-                upcoming_events.append(event)
-            else:
-                other_events.append(event)
-        
-        # Add upcoming event rows
-        for event in upcoming_events:
-            row = EventRow(event)
-            self.upcoming_listbox.append(row)
-        
-        # Add other event rows
-        for event in other_events:
-            row = EventRow(event)
-            self.events_listbox.append(row)
-        
-        # Update group titles with counts
-        if upcoming_events:
-            self.upcoming_group.set_title(f"{_('upcoming_events')} ({len(upcoming_events)})")
-            self.upcoming_group.set_visible(True)
-        else:
-            self.upcoming_group.set_visible(False)
+        wrapped = {event.id for event in
+                   DataManager.shift_days_until([item.event for item in items], days_passed)}
+        sort_key = lambda item: (item.event.days_until, item.event.id)
+        kept = [item for item in items if item.event.id not in wrapped]
+        moved = sorted((item for item in items if item.event.id in wrapped), key=sort_key)
+        self._show_items(list(merge(kept, moved, key=sort_key)))
         
-        if other_events:
-            self.events_group.set_title(f"{_('all_events')} ({len(other_events)})")
-            self.events_group.set_visible(True)
-        else:
-            self.events_group.set_visible(False)
-    
     # Legacy support
     def _load_birthdays(self):
         """Load events (legacy support)."""
@@ -443,14 +417,18 @@ class CandelaWindow(Adw.ApplicationWindow):
         
     def _on_add_clicked(self, button):
         """Handle add button click."""
+        from birthday_dialog import EventDialog
         dialog = EventDialog()
         dialog.connect('event-added', self._on_event_added)
         dialog.present(self)
         
     def _on_event_added(self, dialog, name, day, month, year, notes, event_type, anniversary_type):
         """Handle new event added."""
-        self.data_manager.add_event(name, day, month, year, notes, event_type, anniversary_type)
-        self._load_events()
+        try:
+            self.data_manager.add_event(name, day, month, year, notes, event_type, anniversary_type)
+        except OSError as e:
+            self._on_io_error(e)
+            return
         
         # Show toast
         toast = Adw.Toast.new(_('added_toast').format(name=name))
@@ -460,8 +438,11 @@ class CandelaWindow(Adw.ApplicationWindow):
     # Legacy support
     def _on_birthday_added(self, dialog, name, day, month, year, notes):
         """Handle new birthday added (legacy support)."""
-        self.data_manager.add_birthday(name, day, month, year, notes)
-        self._load_events()
+        try:
+            self.data_manager.add_birthday(name, day, month, year, notes)
+        except OSError as e:
+            self._on_io_error(e)
+            return
         
         toast = Adw.Toast.new(_('added_toast').format(name=name))
         toast.set_timeout(2)
@@ -469,35 +450,46 @@ class CandelaWindow(Adw.ApplicationWindow):
         
     def _on_settings_clicked(self, button):
         """Handle settings button click."""
-        prefs = PreferencesWindow(
-            self.data_manager, 
-            on_language_changed=self._on_language_changed,
-            transient_for=self
-        )
+        from preferences import PreferencesWindow
+        prefs = PreferencesWindow(self.data_manager, transient_for=self)
         prefs.present()
         
     def _on_language_changed(self):
-        """Handle language change - rebuild UI."""
+        """Handle language change - relabel the existing widgets in place."""
         # Update window title
         self.set_title(_('app_title'))
+        self.add_btn.set_tooltip_text(_('add_event'))
+        self.settings_btn.set_tooltip_text(_('settings'))
         
         # Update empty state texts
-        self.empty_title.set_label(_('empty_title'))
-        self.empty_subtitle.set_label(_('empty_subtitle'))
-        
-        # Reload events to update row texts and group titles
-        self._load_events()
-        
-    def _on_row_activated(self, listbox, row):
+        if self.empty_title is not None:
+            self.empty_title.set_label(_('empty_title'))
+            self.empty_subtitle.set_label(_('empty_subtitle'))
+        
+        # Only the rows on screen exist; the rest pick up the language when bound
+        for row in self._bound_rows:
+            row.update_labels()
+        for list_header in self._headers:
+            self._update_header(list_header)
+        
+    def show_event(self, event_id: int) -> bool:
+        """Open the details of an event, e.g. for `candela show ID`; False if there is none."""
+        event = self.data_manager.get_event(event_id)
+        if event is None:
+            return False
+        self._show_event_details(Event.from_dict(event))
+        return True
+        
+    def _on_item_activated(self, list_view, position):
         """Handle row activation (for edit/delete functionality)."""
-        if isinstance(row, (EventRow, BirthdayRow)):
-            event_id = row.get_event_id()
-            self._show_event_details(row, event_id)
+        item = self.event_model.get_item(position)
+        if item is not None:
+            self._show_event_details(item.event)
             
-    def _show_event_details(self, row, event_id):
+    def _show_event_details(self, event_data):
         """Show event details with notes and delete option."""
-        notes = row.get_notes()
-        event_data = row.get_event_data()
+        event_id = event_data.id
+        notes = event_data.notes
         
         # Create dialog
         dialog = Adw.Dialog()
@@ -519,7 +511,7 @@ class CandelaWindow(Adw.ApplicationWindow):
         delete_btn.set_icon_name("user-trash-symbolic")
         delete_btn.add_css_class("destructive-action")
         delete_btn.set_tooltip_text(_('delete'))
-        delete_btn.connect('clicked', self._on_delete_event, dialog, event_id, row.get_title(), event_data)
+        delete_btn.connect('clicked', self._on_delete_event, dialog, event_id, event_data.name, event_data)
         header.pack_start(delete_btn)
         
         main_box.append(header)
@@ -545,12 +537,12 @@ class CandelaWindow(Adw.ApplicationWindow):
         content_box.append(type_label)
         
         # Name label
-        name_label = Gtk.Label(label=row.get_title())
+        name_label = Gtk.Label(label=event_data.name)
         name_label.add_css_class("title-1")
         content_box.append(name_label)
         
         # Date label
-        date_label = Gtk.Label(label=row.get_subtitle())
+        date_label = Gtk.Label(label=format_event_date(event_data))
         date_label.add_css_class("dim-label")
         content_box.append(date_label)
         
@@ -589,13 +581,16 @@ class CandelaWindow(Adw.ApplicationWindow):
     # Legacy support  
     def _show_birthday_details(self, row, birthday_id):
         """Show event details (legacy support)."""
-        self._show_event_details(row, birthday_id)
+        self._show_event_details(row.get_event_data())
         
     def _on_delete_event(self, button, dialog, event_id, name, event_data=None):
         """Handle delete button click."""
         dialog.close()
-        self.data_manager.delete_event(event_id)
-        self._load_events()
+        try:
+            self.data_manager.delete_event(event_id)
+        except OSError as e:
+            self._on_io_error(e)
+            return
         
         # Easter egg: special toast messages based on event type
         toast_message = _('deleted_toast').format(name=name)
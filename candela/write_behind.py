@@ -0,0 +1,168 @@
+"""
+Write Behind - Atomic, coalesced file writes off the calling thread.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+# Bursts of saves within this many seconds collapse into a single write
+SAVE_INTERVAL = 0.5
+
+
+def atomic_write_json(path: Path, data):
+    """Write JSON via a temp file, fsync and rename, so readers never see a torn file."""
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def atomic_write_text(path: Path, text: str):
+    """Write text via a temp file, fsync and rename, so readers never see a torn file."""
+    os.replace(write_temp_text(path, text), path)
+    sync_dir(path.parent)
+
+
+def write_temp_text(path: Path, text: str) -> Path:
+    """Write text to a new, fsynced temp file next to path and return its path.
+
+    Each call gets its own file, so concurrent writers of the same target
+    (other threads or processes) never write into each other's temp file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return Path(tmp_name)
+
+
+def sync_dir(directory: Path):
+    """Persist renames in a directory."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class WriteBehind:
+    """Runs file I/O jobs on a worker thread.
+
+    Keyed jobs are written at most once per interval: scheduling a job for
+    a key that is already pending replaces it, so only the latest state of
+    each file is written. Submitted jobs run as soon as possible, in order,
+    and always before the keyed jobs due at the same time. flush() runs
+    everything still pending on the calling thread and is called on
+    application shutdown. Failures go to on_error, which is called on the
+    worker thread.
+    
+    writes_issued and writes_coalesced count keyed jobs only, the saves
+    that coalescing applies to; jobs_run counts submitted jobs.
+    """
+
+    def __init__(self, interval: float = SAVE_INTERVAL):
+        self.interval = interval
+        self.writes_issued = 0
+        self.writes_coalesced = 0
+        self.jobs_run = 0
+        self.on_error: Optional[Callable[[Exception], None]] = None
+        self._pending: Dict[str, Callable[[], None]] = {}
+        self._queue: List[Callable[[], None]] = []
+        self._writing = False
+        self._cond = threading.Condition()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def schedule(self, key: str, job: Callable[[], None]):
+        """Queue a write job, replacing any pending job for the same key."""
+        with self._cond:
+            if key in self._pending:
+                self.writes_coalesced += 1
+            self._pending[key] = job
+            self._start()
+
+    def submit(self, job: Callable[[], None]):
+        """Queue a job to run next on the worker thread, after earlier submitted jobs."""
+        with self._cond:
+            self._queue.append(job)
+            self._start()
+
+    def _start(self):
+        """Wake the worker, starting it on first use. Call with the lock held."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='candela-writer', daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    def flush(self):
+        """Run all pending jobs now and wait for in-flight ones."""
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            jobs = [(job, False) for job in self._queue]
+            jobs += [(job, True) for job in self._pending.values()]
+            self._queue.clear()
+            self._pending.clear()
+        for job, keyed in jobs:
+            self._issue(job, keyed)
+
+    def _run(self):
+        """Worker loop: run submitted jobs at once; let keyed bursts settle first."""
+        deadline = None
+        while True:
+            with self._cond:
+                while True:
+                    if self._queue:
+                        jobs = [(job, False) for job in self._queue]
+                        self._queue.clear()
+                        break
+                    if not self._pending:
+                        deadline = None
+                        self._cond.wait()
+                        continue
+                    if deadline is None:
+                        deadline = time.monotonic() + self.interval
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        jobs = [(job, True) for job in self._pending.values()]
+                        self._pending.clear()
+                        deadline = None
+                        break
+                    self._cond.wait(remaining)
+                self._writing = True
+            try:
+                for job, keyed in jobs:
+                    self._issue(job, keyed)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _issue(self, job: Callable[[], None], keyed: bool):
+        """Run one job and count it as a write if it was scheduled by key."""
+        try:
+            job()
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(e)
+            else:
+                print(f"Error in deferred write: {e}")
+        with self._cond:
+            if keyed:
+                self.writes_issued += 1
+            else:
+                self.jobs_run += 1
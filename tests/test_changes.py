@@ -0,0 +1,157 @@
+"""
+EventChange positions - replaying every change on a mirrored listing must
+give the same order as a fresh get_sorted_events(), on both backends, and
+the window's list edits must build one row item per change at most.
+
+Run with `python -m pytest tests`; needs no GTK.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'candela'))
+
+from data_manager import (CHANGE_ADDED, CHANGE_REMOVED, CHANGE_RESET, CHANGE_UPDATED,  # noqa: E402
+                          DataManager)
+from listing import apply_change  # noqa: E402
+
+
+OPERATIONS = 400
+
+# Wide enough that both list sections get plenty of events
+UPCOMING_DAYS = 120
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def data_manager(request, tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path))
+    monkeypatch.setenv('CANDELA_STORAGE', request.param)
+    manager = DataManager()
+    yield manager
+    manager.flush()
+
+
+def _random_date(rng):
+    month = rng.randint(1, 12)
+    # Few distinct dates, so many events tie and break on id
+    return rng.choice((1, 15, 28, 29 if month == 2 else 30)), month
+
+
+def _ids(data_manager):
+    return [event.id for event in data_manager.get_sorted_events()]
+
+
+def _random_step(data_manager, rng, step, ids):
+    """Add, update or delete a random event."""
+    roll = rng.random()
+    if roll < 0.4 or not ids:
+        day, month = _random_date(rng)
+        data_manager.add_event(f'event {step}', day, month)
+    elif roll < 0.8:
+        fields = {'name': f'renamed {step}'}
+        if rng.random() < 0.7:
+            fields['day'], fields['month'] = _random_date(rng)
+        data_manager.update_event(rng.choice(ids), **fields)
+    else:
+        data_manager.delete_event(rng.choice(ids))
+
+
+class CountingStore:
+    """List standing in for a Gio.ListStore, counting every edit."""
+
+    def __init__(self, edits, items=()):
+        self.items = list(items)
+        self.edits = edits
+
+    def get_n_items(self):
+        return len(self.items)
+
+    def splice(self, position, n_removals, additions):
+        self.edits.append('splice')
+        self.items[position:position + n_removals] = additions
+
+    def insert(self, position, item):
+        self.edits.append('insert')
+        self.items.insert(position, item)
+
+    def remove(self, position):
+        self.edits.append('remove')
+        del self.items[position]
+
+
+class CountingItem:
+    """Stands in for EventObject; counts how many are built."""
+
+    built = 0
+
+    def __init__(self, event):
+        CountingItem.built += 1
+        self.event = event
+
+
+def test_change_positions_follow_sorted_listing(data_manager):
+    rng = random.Random(12)
+    for i in range(20):
+        day, month = _random_date(rng)
+        data_manager.add_event(f'seed {i}', day, month)
+
+    mirror = _ids(data_manager)
+    changes = []
+    data_manager.add_change_listener(changes.append)
+
+    for step in range(OPERATIONS):
+        _random_step(data_manager, rng, step, mirror)
+
+        assert len(changes) == 1, f'step {step}: expected one change, got {changes}'
+        change = changes.pop()
+        assert change.kind != CHANGE_RESET
+        if change.kind in (CHANGE_REMOVED, CHANGE_UPDATED):
+            assert mirror.pop(change.old_position) == change.event_id
+        if change.kind in (CHANGE_ADDED, CHANGE_UPDATED):
+            assert change.event.id == change.event_id
+            mirror.insert(change.new_position, change.event_id)
+
+        assert mirror == [event.id for event in data_manager.iter_sorted_events()], f'step {step}'
+
+    assert mirror == _ids(data_manager)
+
+
+def test_window_edits_one_item_per_change(data_manager):
+    rng = random.Random(13)
+    for i in range(40):
+        day, month = _random_date(rng)
+        data_manager.add_event(f'seed {i}', day, month)
+
+    events = data_manager.get_sorted_events()
+    edits = []
+    upcoming = CountingStore(edits, [CountingItem(e) for e in events
+                                     if e.days_until <= UPCOMING_DAYS])
+    others = CountingStore(edits, [CountingItem(e) for e in events
+                                   if e.days_until > UPCOMING_DAYS])
+    changes = []
+    data_manager.add_change_listener(changes.append)
+
+    for step in range(OPERATIONS):
+        ids = [item.event.id for item in upcoming.items + others.items]
+        _random_step(data_manager, rng, step, ids)
+        change = changes.pop()
+        edits.clear()
+        CountingItem.built = 0
+        apply_change(upcoming, others, change, UPCOMING_DAYS, CountingItem)
+
+        if change.kind == CHANGE_ADDED:
+            assert (CountingItem.built, edits) == (1, ['insert'])
+        elif change.kind == CHANGE_REMOVED:
+            assert (CountingItem.built, edits) == (0, ['remove'])
+        else:
+            assert CountingItem.built == 1
+            assert edits in (['splice'], ['remove', 'insert'])
+
+        listing = list(data_manager.iter_sorted_events())
+        assert [item.event.id for item in upcoming.items + others.items] == \
+            [event.id for event in listing], f'step {step}'
+        assert all(item.event.days_until <= UPCOMING_DAYS for item in upcoming.items)
+        assert all(item.event.days_until > UPCOMING_DAYS for item in others.items)